@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import hashlib
 import json
 import locale
 import os
+import queue
 import re
 import shutil
 import subprocess
@@ -11,10 +14,14 @@ import sys
 import tempfile
 import threading
 import time
+import urllib.error
 import urllib.request
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Iterable
 
@@ -24,8 +31,20 @@ except Exception:
     np = None
 
 from platformdirs import user_config_dir
-from PySide6.QtCore import QPoint, Qt, QTimer, QUrl
-from PySide6.QtGui import QDesktopServices, QFont, QGuiApplication, QImage, QMouseEvent, QPainter, QPixmap, QWheelEvent
+from PySide6.QtCore import QAbstractListModel, QByteArray, QModelIndex, QObject, QPoint, QRectF, QRunnable, QSize, Qt, QThreadPool, QTimer, QUrl, Signal
+from PySide6.QtGui import (
+    QDesktopServices,
+    QFont,
+    QGuiApplication,
+    QImage,
+    QImageReader,
+    QMouseEvent,
+    QOpenGLContext,
+    QPainter,
+    QPixmap,
+    QTransform,
+    QWheelEvent,
+)
 from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtWidgets import (
     QApplication,
@@ -34,14 +53,18 @@ from PySide6.QtWidgets import (
     QDialog,
     QFileDialog,
     QFrame,
+    QGraphicsPixmapItem,
+    QGraphicsScene,
+    QGraphicsTextItem,
+    QGraphicsView,
     QGridLayout,
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
-    QListView,
     QMainWindow,
     QMessageBox,
     QPlainTextEdit,
@@ -49,6 +72,7 @@ from PySide6.QtWidgets import (
     QRadioButton,
     QSizePolicy,
     QScrollArea,
+    QScrollBar,
     QSpacerItem,
     QSplitter,
     QStackedWidget,
@@ -56,6 +80,10 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except Exception:
+    QOpenGLWidget = None
 try:
     from . import __version__
 except Exception:
@@ -79,11 +107,32 @@ MAX_RECENT = 20
 DEFAULT_TIMELINE_LIMIT = 50
 BACKUP_DIR_NAME = "snapshot_backups"
 GITHUB_LATEST_RELEASE_API = "https://api.github.com/repos/tanakamasayuki/kicad-snapshot/releases/latest"
+LATEST_RELEASE_CHECK_TTL_SECONDS = 3600
 SUPPORTED_LANGUAGES = ("en", "ja", "zh", "fr", "de")
 ENABLE_PERF_LOG = False
 COMPARE_RENDER_SCALE_OPTIONS = (1.0, 1.5, 2.0, 3.0, 4.0, 5.0)
 DEFAULT_COMPARE_RENDER_SCALE = 2.0
 MAX_RENDER_DIMENSION = 12000
+RESULT_RENDER_CACHE_SIZE = 8
+SVG_RENDERER_CACHE_SIZE = 16
+COMPARE_QIMAGE_CACHE_SIZE = 16
+COMPARE_RENDER_SESSIONS_KEPT = 4
+_SAFE_KEY_RE = re.compile(r"[^A-Za-z0-9._-]+")
+COMPARE_RENDER_SUFFIXES = (
+    ".kicad_sch",
+    ".kicad_pcb",
+    ".kicad_pro",
+    ".kicad_sym",
+    ".kicad_mod",
+    ".kicad_dru",
+    ".kicad_wks",
+    ".lib",
+)
+MAX_PARALLEL_EXPORTS = 4
+MAX_PRECACHE_WORKERS = 4
+# Renders are filled white, so alpha is unused: opaque 32-bit pixels compare as one uint32,
+# paint without conversion and save as RGB PNGs.
+DIFF_IMAGE_FORMAT = QImage.Format_RGB32
 
 
 def perf_log(message: str) -> None:
@@ -726,14 +775,14 @@ for _lang, _table in TRANSLATIONS.items():
         _table.setdefault(_key, _value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CliCandidate:
     path: Path
     version: tuple[int, ...]
     version_text: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SnapshotItem:
     source: str
     identifier: str
@@ -794,6 +843,18 @@ class SettingsStore:
         if isinstance(window_height, int):
             lines.append(f"window_height = {window_height}")
 
+        latest_release_tag = data.get("latest_release_tag")
+        if isinstance(latest_release_tag, str):
+            lines.append(f'latest_release_tag = {self._quote(latest_release_tag)}')
+
+        latest_release_etag = data.get("latest_release_etag")
+        if isinstance(latest_release_etag, str):
+            lines.append(f'latest_release_etag = {self._quote(latest_release_etag)}')
+
+        latest_release_ts = data.get("latest_release_ts")
+        if isinstance(latest_release_ts, int):
+            lines.append(f"latest_release_ts = {latest_release_ts}")
+
         last_project = data.get("last_project")
         if isinstance(last_project, str):
             lines.append(f'last_project = {self._quote(last_project)}')
@@ -829,7 +890,15 @@ def parse_version_text(raw: str) -> tuple[tuple[int, ...] | None, str]:
     return version_tuple, version_text
 
 
-def run_subprocess(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+def precache_worker_limit() -> int:
+    cpu = os.cpu_count() or 1
+    # Free-threaded builds (3.13t+) run render workers truly in parallel, so every core is usable.
+    if getattr(sys, "_is_gil_enabled", lambda: True)() is False:
+        return cpu
+    return min(MAX_PRECACHE_WORKERS, cpu)
+
+
+def _hide_console_window(kwargs: dict) -> dict:
     if sys.platform.startswith("win"):
         flags = int(kwargs.pop("creationflags", 0))
         kwargs["creationflags"] = flags | int(getattr(subprocess, "CREATE_NO_WINDOW", 0))
@@ -839,7 +908,32 @@ def run_subprocess(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
         startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
         startupinfo.wShowWindow = 0  # SW_HIDE
         kwargs["startupinfo"] = startupinfo
-    return subprocess.run(cmd, **kwargs)
+    return kwargs
+
+
+def run_subprocess(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+    return subprocess.run(cmd, **_hide_console_window(kwargs))
+
+
+async def run_subprocess_async(cmd: list[str], timeout: float) -> subprocess.CompletedProcess:
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        **_hide_console_window({}),
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return subprocess.CompletedProcess(
+        cmd,
+        proc.returncode,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
 
 
 def probe_kicad_cli(path: Path) -> CliCandidate | None:
@@ -867,6 +961,20 @@ def probe_kicad_cli(path: Path) -> CliCandidate | None:
     return CliCandidate(path=path, version=version, version_text=version_text)
 
 
+@lru_cache(maxsize=32)
+def _probe_cached(path_text: str, mtime_ns: int) -> CliCandidate | None:
+    return probe_kicad_cli(Path(path_text))
+
+
+def probe_kicad_cli_cached(path: Path) -> CliCandidate | None:
+    # Keyed by mtime so a reinstalled or replaced kicad-cli is probed again.
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _probe_cached(str(path), mtime_ns)
+
+
 def discover_kicad_cli_candidates(manual_path: str | None) -> list[CliCandidate]:
     checked: set[Path] = set()
     candidates: list[CliCandidate] = []
@@ -885,7 +993,7 @@ def discover_kicad_cli_candidates(manual_path: str | None) -> list[CliCandidate]
             continue
         checked.add(resolved)
 
-        candidate = probe_kicad_cli(resolved)
+        candidate = probe_kicad_cli_cached(resolved)
         if candidate:
             candidates.append(candidate)
 
@@ -1093,8 +1201,14 @@ def backup_whitelist_paths(project_dir: Path) -> list[Path]:
     return selected
 
 
+@lru_cache(maxsize=16)
+def _project_dir(project_file: Path) -> Path:
+    # resolve() stats every path component; the project location is stable for a session.
+    return project_file.resolve().parent
+
+
 def build_current_project_map(project_file: Path) -> dict[str, bytes]:
-    project_dir = project_file.resolve().parent
+    project_dir = _project_dir(project_file)
     result: dict[str, bytes] = {}
     for path in backup_whitelist_paths(project_dir):
         rel = path.relative_to(project_dir).as_posix()
@@ -1122,7 +1236,7 @@ def build_backup_zip_map(zip_path: Path) -> dict[str, bytes]:
 
 
 def build_git_commit_map(project_file: Path, commit_hash: str, git_path: str | None) -> dict[str, bytes]:
-    project_dir = project_file.resolve().parent
+    project_dir = _project_dir(project_file)
     repo_root = detect_git_repo_root(project_dir, git_path)
     if repo_root is None:
         return {}
@@ -1178,12 +1292,37 @@ def compare_file_maps(before: dict[str, bytes], after: dict[str, bytes]) -> tupl
 
 
 def write_file_map(root: Path, file_map: dict[str, bytes]) -> None:
+    created: set[Path] = set()
     for rel, data in file_map.items():
         out_path = root / rel
-        out_path.parent.mkdir(parents=True, exist_ok=True)
+        parent = out_path.parent
+        if parent not in created:
+            parent.mkdir(parents=True, exist_ok=True)
+            created.add(parent)
         out_path.write_bytes(data)
 
 
+def write_file_map_filtered(
+    root: Path,
+    file_map: dict[str, bytes],
+    predicate: Callable[[str], bool],
+) -> dict[str, bytes]:
+    selected: dict[str, bytes] = {}
+    deferred: dict[str, bytes] = {}
+    for rel, data in file_map.items():
+        if predicate(rel):
+            selected[rel] = data
+        else:
+            deferred[rel] = data
+    write_file_map(root, selected)
+    return deferred
+
+
+def is_compare_render_input(rel: str) -> bool:
+    name = rel.rsplit("/", 1)[-1]
+    return name.endswith(COMPARE_RENDER_SUFFIXES) or name in {"sym-lib-table", "fp-lib-table"} or ".pretty/" in rel
+
+
 def first_matching_file(root: Path, suffix: str) -> Path | None:
     matches = sorted(root.rglob(f"*{suffix}"))
     if not matches:
@@ -1191,13 +1330,13 @@ def first_matching_file(root: Path, suffix: str) -> Path | None:
     return matches[0]
 
 
-def export_svg_bundle_with_kicad_cli(
+def build_svg_export_commands(
     cli_path: Path,
     source_file: Path,
     out_dir: Path,
     kind: str,
     pcb_layers: str | None = None,
-) -> list[Path]:
+) -> list[list[str]]:
     if kind == "sch":
         commands = [
             [str(cli_path), "sch", "export", "svg", str(source_file), "-o", str(out_dir)],
@@ -1242,9 +1381,18 @@ def export_svg_bundle_with_kicad_cli(
             ]
     else:
         raise RuntimeError(f"Unsupported kind: {kind}")
+    return commands
 
+
+def export_svg_bundle_with_kicad_cli(
+    cli_path: Path,
+    source_file: Path,
+    out_dir: Path,
+    kind: str,
+    pcb_layers: str | None = None,
+) -> list[Path]:
     last_err = ""
-    for cmd in commands:
+    for cmd in build_svg_export_commands(cli_path, source_file, out_dir, kind, pcb_layers):
         result = run_subprocess(cmd, check=False, capture_output=True, text=True, timeout=40)
         if result.returncode == 0:
             svgs = sorted(out_dir.rglob("*.svg"))
@@ -1256,12 +1404,82 @@ def export_svg_bundle_with_kicad_cli(
     raise RuntimeError(last_err or "kicad-cli export failed")
 
 
+def export_pcb_layer_svgs_with_kicad_cli(
+    cli_path: Path,
+    source_file: Path,
+    out_dir: Path,
+    layers: list[str],
+) -> dict[str, Path]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    cmd = [
+        str(cli_path),
+        "pcb",
+        "export",
+        "svg",
+        "--mode-multi",
+        "--layers",
+        ",".join(layers),
+        str(source_file),
+        "-o",
+        str(out_dir),
+    ]
+    result = run_subprocess(cmd, check=False, capture_output=True, text=True, timeout=120)
+    if result.returncode != 0:
+        raise RuntimeError((result.stderr or result.stdout or "").strip() or "kicad-cli export failed")
+    # kicad-cli names multi-mode output "<board>-<layer>.svg" with dots in layer names replaced.
+    svgs: dict[str, Path] = {}
+    for layer in layers:
+        svg = out_dir / f"{source_file.stem}-{layer.replace('.', '_')}.svg"
+        if svg.exists():
+            svgs[layer] = svg
+    return svgs
+
+
+async def export_svg_bundle_with_kicad_cli_async(
+    cli_path: Path,
+    source_file: Path,
+    out_dir: Path,
+    kind: str,
+    pcb_layers: str | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+) -> list[Path]:
+    last_err = ""
+    for cmd in build_svg_export_commands(cli_path, source_file, out_dir, kind, pcb_layers):
+        async with semaphore or contextlib.nullcontext():
+            result = await run_subprocess_async(cmd, timeout=40)
+        if result.returncode == 0:
+            svgs = sorted(out_dir.rglob("*.svg"))
+            if svgs:
+                return svgs
+            last_err = "No SVG exported by kicad-cli"
+        else:
+            last_err = (result.stderr or result.stdout or "").strip() or "kicad-cli export failed"
+    raise RuntimeError(last_err or "kicad-cli export failed")
+
+
+def load_svg_renderer(svg_path: Path) -> QSvgRenderer:
+    renderer = QSvgRenderer(QByteArray(svg_path.read_bytes()))
+    if not renderer.isValid():
+        raise RuntimeError(f"Invalid SVG: {svg_path}")
+    return renderer
+
+
 def render_svg_to_image(svg_path: Path, scale: float = DEFAULT_COMPARE_RENDER_SCALE) -> QImage:
     t0 = time.perf_counter()
     renderer = QSvgRenderer(str(svg_path))
     if not renderer.isValid():
         raise RuntimeError(f"Invalid SVG: {svg_path}")
+    return render_svg_renderer_to_image(renderer, svg_path.name, scale, t0)
 
+
+def render_svg_renderer_to_image(
+    renderer: QSvgRenderer,
+    name: str,
+    scale: float = DEFAULT_COMPARE_RENDER_SCALE,
+    t0: float | None = None,
+) -> QImage:
+    if t0 is None:
+        t0 = time.perf_counter()
     size = renderer.defaultSize()
     base_w = float(size.width())
     base_h = float(size.height())
@@ -1292,7 +1510,7 @@ def render_svg_to_image(svg_path: Path, scale: float = DEFAULT_COMPARE_RENDER_SC
     width = max(1, min(int(round(base_w * applied_scale)), MAX_RENDER_DIMENSION))
     height = max(1, min(int(round(base_h * applied_scale)), MAX_RENDER_DIMENSION))
 
-    image = QImage(width, height, QImage.Format_ARGB32)
+    image = QImage(width, height, DIFF_IMAGE_FORMAT)
     image.fill(Qt.white)
     painter = QPainter(image)
     renderer.render(painter)
@@ -1300,7 +1518,7 @@ def render_svg_to_image(svg_path: Path, scale: float = DEFAULT_COMPARE_RENDER_SC
     elapsed = time.perf_counter() - t0
     perf_log(
         "render_svg_to_image "
-        f"path={svg_path.name} base={int(round(base_w))}x{int(round(base_h))} "
+        f"path={name} base={int(round(base_w))}x{int(round(base_h))} "
         f"scale={applied_scale:g} out={width}x{height} elapsed={elapsed:.3f}s"
     )
     return image
@@ -1309,7 +1527,7 @@ def render_svg_to_image(svg_path: Path, scale: float = DEFAULT_COMPARE_RENDER_SC
 def pad_image(image: QImage, width: int, height: int) -> QImage:
     if image.width() == width and image.height() == height:
         return image
-    out = QImage(width, height, QImage.Format_ARGB32)
+    out = QImage(width, height, image.format())
     out.fill(Qt.white)
     painter = QPainter(out)
     painter.drawImage(0, 0, image)
@@ -1317,25 +1535,19 @@ def pad_image(image: QImage, width: int, height: int) -> QImage:
     return out
 
 
-def _qimage_to_numpy_rgba(image: QImage):
-    if np is None:
-        return None
-    rgba = image.convertToFormat(QImage.Format_RGBA8888)
-    ptr = rgba.bits()
-    h = rgba.height()
-    w = rgba.width()
-    bpl = rgba.bytesPerLine()
-    # Copy to detach from QImage lifetime (prevents dangling buffer issues).
-    arr = np.frombuffer(ptr, dtype=np.uint8, count=h * bpl).copy().reshape((h, bpl))
-    arr = arr[:, : w * 4].reshape((h, w, 4))
-    return arr
-
-
-def _numpy_rgba_to_qimage(arr) -> QImage:
-    out = np.ascontiguousarray(arr, dtype=np.uint8)
+def _qimage_pixel_view(image: QImage):
+    # One uint32 per 32-bit pixel, aliasing the image buffer; keep ``image`` alive while in use.
+    h = image.height()
+    bpl = image.bytesPerLine()
+    arr = np.frombuffer(image.constBits(), dtype=np.uint32, count=h * bpl // 4).reshape((h, bpl // 4))
+    return arr[:, : image.width()]
+
+
+def _numpy_pixels_to_qimage(arr) -> QImage:
+    out = np.ascontiguousarray(arr, dtype=np.uint32)
     h, w = out.shape[:2]
-    image = QImage(out.data, w, h, w * 4, QImage.Format_RGBA8888)
-    return image.copy().convertToFormat(QImage.Format_ARGB32)
+    image = QImage(out.data, w, h, w * 4, DIFF_IMAGE_FORMAT)
+    return image.copy()
 
 
 def make_pixel_diff_image(before: QImage, after: QImage) -> QImage:
@@ -1343,16 +1555,10 @@ def make_pixel_diff_image(before: QImage, after: QImage) -> QImage:
     height = max(before.height(), after.height())
     b = pad_image(before, width, height)
     a = pad_image(after, width, height)
+    if np is not None:
+        return compare_pixel_images(b, a)[1]
 
-    b_arr = _qimage_to_numpy_rgba(b)
-    a_arr = _qimage_to_numpy_rgba(a)
-    if b_arr is not None and a_arr is not None:
-        eq = np.all(b_arr == a_arr, axis=2)
-        red = np.array([255, 64, 64, 255], dtype=np.uint8)
-        out = np.where(eq[:, :, None], a_arr, red)
-        return _numpy_rgba_to_qimage(out)
-
-    diff = QImage(width, height, QImage.Format_ARGB32)
+    diff = QImage(width, height, DIFF_IMAGE_FORMAT)
     diff.fill(Qt.white)
     for y in range(height):
         for x in range(width):
@@ -1365,15 +1571,35 @@ def make_pixel_diff_image(before: QImage, after: QImage) -> QImage:
     return diff
 
 
+def compare_pixel_images(before: QImage, after: QImage) -> tuple[bool, QImage]:
+    width = max(before.width(), after.width())
+    height = max(before.height(), after.height())
+    b = pad_image(before, width, height)
+    a = pad_image(after, width, height)
+    if np is None:
+        return images_different(b, a), make_pixel_diff_image(b, a)
+    b = b.convertToFormat(DIFF_IMAGE_FORMAT)
+    a = a.convertToFormat(DIFF_IMAGE_FORMAT)
+    b_px = _qimage_pixel_view(b)
+    a_px = _qimage_pixel_view(a)
+    # A single mask yields both the status and the overlay; NumPy releases the GIL for these passes.
+    changed = b_px != a_px
+    has_diff = bool(changed.any())
+    out = a_px.copy()
+    if has_diff:
+        out[changed] = np.uint32(0xFFFF4040)
+    return has_diff, _numpy_pixels_to_qimage(out)
+
+
 def images_different(before: QImage, after: QImage) -> bool:
     width = max(before.width(), after.width())
     height = max(before.height(), after.height())
     b = pad_image(before, width, height)
     a = pad_image(after, width, height)
-    b_arr = _qimage_to_numpy_rgba(b)
-    a_arr = _qimage_to_numpy_rgba(a)
-    if b_arr is not None and a_arr is not None:
-        return bool(np.any(b_arr != a_arr))
+    if np is not None:
+        b = b.convertToFormat(DIFF_IMAGE_FORMAT)
+        a = a.convertToFormat(DIFF_IMAGE_FORMAT)
+        return bool((_qimage_pixel_view(b) != _qimage_pixel_view(a)).any())
     for y in range(height):
         for x in range(width):
             if b.pixel(x, y) != a.pixel(x, y):
@@ -1404,6 +1630,27 @@ def parse_pcb_layers_from_file(pcb_path: Path) -> list[str]:
     return unique
 
 
+def _collect_kicad_files(root: Path) -> tuple[set[str], set[str]]:
+    sch_paths: set[str] = set()
+    pcb_paths: set[str] = set()
+    stack = [(root, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((Path(entry.path), f"{prefix}{entry.name}/"))
+                    elif entry.is_file(follow_symlinks=False):
+                        if entry.name.endswith(".kicad_sch"):
+                            sch_paths.add(prefix + entry.name)
+                        elif entry.name.endswith(".kicad_pcb"):
+                            pcb_paths.add(prefix + entry.name)
+        except OSError:
+            continue
+    return sch_paths, pcb_paths
+
+
 def detect_pcb_layers(cli_path: Path, pcb_path: Path) -> list[str]:
     candidates = [
         [str(cli_path), "pcb", "layers", "list", str(pcb_path)],
@@ -1446,7 +1693,7 @@ def sanitize_memo_for_filename(memo: str) -> str:
 
 
 def create_project_backup(project_file: Path, memo: str = "") -> Path:
-    project_dir = project_file.resolve().parent
+    project_dir = _project_dir(project_file)
     project_name = project_file.stem
     backup_dir = project_dir / f"{project_dir.name}-backups"
     backup_dir.mkdir(parents=True, exist_ok=True)
@@ -1471,7 +1718,7 @@ def create_project_backup(project_file: Path, memo: str = "") -> Path:
 
 
 def collect_backup_items(project_file: Path, limit: int) -> list[SnapshotItem]:
-    project_dir = project_file.resolve().parent
+    project_dir = _project_dir(project_file)
     local_named_backup_dir = project_dir / f"{project_dir.name}-backups"
     sibling_backup_dir = project_dir.parent / f"{project_dir.name}-backups"
     candidate_dirs = [
@@ -1524,7 +1771,7 @@ def collect_backup_items(project_file: Path, limit: int) -> list[SnapshotItem]:
 
 
 def collect_git_items(project_file: Path, git_path: str | None, limit: int) -> list[SnapshotItem]:
-    project_dir = project_file.resolve().parent
+    project_dir = _project_dir(project_file)
     repo_root = detect_git_repo_root(project_dir, git_path)
     if not repo_root:
         return []
@@ -1564,6 +1811,12 @@ def collect_git_items(project_file: Path, git_path: str | None, limit: int) -> l
     return items[:limit]
 
 
+@lru_cache(maxsize=1024)
+def _translate(language: str, key: str) -> str:
+    text = TRANSLATIONS.get(language, TRANSLATIONS["en"]).get(key)
+    return TRANSLATIONS["en"].get(key, key) if text is None else text
+
+
 def normalize_language(code: str | None) -> str:
     if not code:
         return "en"
@@ -1589,6 +1842,164 @@ def detect_environment_language() -> str:
     return "en"
 
 
+@lru_cache(maxsize=1)
+def app_font() -> QFont:
+    return QFont("Segoe UI", 10)
+
+
+@lru_cache(maxsize=4)
+def heading_font(point_size: int) -> QFont:
+    # Shared by page titles; setFont copies the value, so one instance per size is enough.
+    font = QFont(app_font())
+    font.setPointSize(point_size)
+    font.setBold(True)
+    return font
+
+
+@lru_cache(maxsize=1)
+def opengl_available() -> bool:
+    if QOpenGLWidget is None:
+        return False
+    # Remote desktops and some VMs have no usable GL; fall back to the raster viewport there.
+    return QOpenGLContext().create()
+
+
+def create_image_view(scene: QGraphicsScene) -> QGraphicsView:
+    view = QGraphicsView(scene)
+    if opengl_available():
+        view.setViewport(QOpenGLWidget())
+        view.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+    view.setRenderHint(QPainter.SmoothPixmapTransform, True)
+    view.setTransformationAnchor(QGraphicsView.AnchorViewCenter)
+    view.setResizeAnchor(QGraphicsView.AnchorViewCenter)
+    return view
+
+
+COMPARE_STATUSES = ("pending", "rendering", "same", "diff", "error")
+_COMPARE_STATUS_INDEX = {name: i for i, name in enumerate(COMPARE_STATUSES)}
+
+
+class CompareTargetModel(QAbstractListModel):
+    # Parallel per-row arrays; statuses are small ints so workers can update them cheaply.
+    def __init__(self, formatter: Callable[[str, str], str], parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._formatter = formatter
+        self.labels: list[str] = []
+        self.keys: list[str] = []
+        self.statuses: list[int] = []
+        # Display strings built once per row and only rebuilt for rows whose status changed.
+        self.texts: list[str] = []
+        self._rows: dict[str, int] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.labels)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self.texts[index.row()]
+
+    def _format_row(self, row: int) -> str:
+        return self._formatter(self.labels[row], COMPARE_STATUSES[self.statuses[row]])
+
+    def reset(
+        self,
+        labels: list[str],
+        keys: list[str],
+        statuses: list[str],
+        lock: contextlib.AbstractContextManager | None = None,
+    ) -> None:
+        # Build the new rows up front so the optional lock only covers the swap, not Qt's view reset.
+        labels = list(labels)
+        keys = list(keys)
+        values = [_COMPARE_STATUS_INDEX.get(status, _COMPARE_STATUS_INDEX["error"]) for status in statuses]
+        rows = {key: row for row, key in enumerate(keys)}
+        texts = [self._formatter(label, COMPARE_STATUSES[value]) for label, value in zip(labels, values)]
+        self.beginResetModel()
+        with lock or contextlib.nullcontext():
+            self.labels, self.keys, self.statuses, self._rows, self.texts = labels, keys, values, rows, texts
+        self.endResetModel()
+
+    def status(self, key: str, default: str = "pending") -> str:
+        row = self._rows.get(key)
+        return default if row is None else COMPARE_STATUSES[self.statuses[row]]
+
+    def status_map(self) -> dict[str, str]:
+        return {key: COMPARE_STATUSES[value] for key, value in zip(self.keys, self.statuses)}
+
+    def set_status(self, key: str, status: str, only_from: Iterable[str] | None = None) -> int:
+        # Returns the changed row, or -1 when nothing changed; callers emit dataChanged on the GUI thread.
+        row = self._rows.get(key)
+        value = _COMPARE_STATUS_INDEX.get(status, _COMPARE_STATUS_INDEX["error"])
+        if row is None or self.statuses[row] == value:
+            return -1
+        if only_from is not None and COMPARE_STATUSES[self.statuses[row]] not in only_from:
+            return -1
+        self.statuses[row] = value
+        return row
+
+    def notify_rows(self, rows: Iterable[int]) -> None:
+        for row in rows:
+            if not 0 <= row < len(self.labels):
+                continue
+            text = self._format_row(row)
+            if text == self.texts[row]:
+                continue
+            self.texts[row] = text
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def notify_all(self) -> None:
+        if self.labels:
+            self.texts = [self._format_row(row) for row in range(len(self.labels))]
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.labels) - 1, 0), [Qt.DisplayRole])
+
+
+class CompareTargetListView(QListView):
+    currentRowChanged = Signal(int)
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setUniformItemSizes(True)
+
+    def setModel(self, model) -> None:
+        super().setModel(model)
+        self.selectionModel().currentRowChanged.connect(
+            lambda current, _previous: self.currentRowChanged.emit(current.row())
+        )
+
+    def count(self) -> int:
+        model = self.model()
+        return model.rowCount() if model is not None else 0
+
+    def currentRow(self) -> int:
+        return self.currentIndex().row()
+
+    def setCurrentRow(self, row: int) -> None:
+        self.setCurrentIndex(self.model().index(row, 0))
+
+
+class BackgroundTaskSignals(QObject):
+    finished = Signal(str, object)
+    failed = Signal(str, str)
+
+
+class BackgroundTask(QRunnable):
+    def __init__(self, key: str, func: Callable[[], object]) -> None:
+        super().__init__()
+        self.key = key
+        self.func = func
+        self.signals = BackgroundTaskSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.func()
+        except Exception as exc:
+            self.signals.failed.emit(self.key, str(exc))
+            return
+        self.signals.finished.emit(self.key, result)
+
+
 class SnapshotCompareDialog(QDialog):
     def __init__(
         self,
@@ -1971,6 +2382,37 @@ class EmptyCompareDialog(QDialog):
         root.addLayout(actions)
 
 
+class ScaledImageLabel(QLabel):
+    # Draws an unscaled pixmap through the painter transform, so zooming never allocates a resampled copy.
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._pix: QPixmap | None = None
+        self._scale = 1.0
+
+    def set_scaled_pixmap(self, pixmap: QPixmap, scale: float) -> None:
+        if pixmap is self._pix and scale == self._scale:
+            return
+        self._pix = pixmap
+        self._scale = scale
+        QLabel.setText(self, "")
+        self.resize(max(1, int(pixmap.width() * scale)), max(1, int(pixmap.height() * scale)))
+        self.update()
+
+    def clear(self) -> None:
+        self._pix = None
+        super().clear()
+
+    def paintEvent(self, event) -> None:
+        if self._pix is None:
+            super().paintEvent(event)
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.scale(self._scale, self._scale)
+        painter.drawPixmap(0, 0, self._pix)
+        painter.end()
+
+
 class CompareImageScrollArea(QScrollArea):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -2148,31 +2590,16 @@ class ItemDiffDialog(QDialog):
         write_file_map(self.before_root, self.before_map)
         write_file_map(self.after_root, self.after_map)
 
-        sch_paths = sorted(
-            {
-                p.relative_to(self.before_root).as_posix()
-                for p in self.before_root.rglob("*.kicad_sch")
-            }
-            | {
-                p.relative_to(self.after_root).as_posix()
-                for p in self.after_root.rglob("*.kicad_sch")
-            }
-        )
-        for rel_path in sch_paths:
+        # One scan per tree collects both kinds; merge the after side into the before sets in place.
+        sch_paths, pcb_paths = _collect_kicad_files(self.before_root)
+        after_sch, after_pcb = _collect_kicad_files(self.after_root)
+        sch_paths |= after_sch
+        pcb_paths |= after_pcb
+        for rel_path in sorted(sch_paths):
             self.targets.append({"kind": "sch", "path": rel_path, "layer": None})
             self.target_list.addItem(f"SCH / {rel_path}")
 
-        pcb_paths = sorted(
-            {
-                p.relative_to(self.before_root).as_posix()
-                for p in self.before_root.rglob("*.kicad_pcb")
-            }
-            | {
-                p.relative_to(self.after_root).as_posix()
-                for p in self.after_root.rglob("*.kicad_pcb")
-            }
-        )
-        for rel_path in pcb_paths:
+        for rel_path in sorted(pcb_paths):
             self.targets.append({"kind": "pcb", "path": rel_path, "layer": None})
             self.target_list.addItem(f"PCB / {rel_path} / board")
 
@@ -2253,10 +2680,10 @@ class ItemDiffDialog(QDialog):
         if before_img is None and after_img is None:
             raise RuntimeError(self.t("compare_image_not_available"))
         if before_img is None:
-            before_img = QImage(after_img.width(), after_img.height(), QImage.Format_ARGB32)  # type: ignore[union-attr]
+            before_img = QImage(after_img.width(), after_img.height(), DIFF_IMAGE_FORMAT)  # type: ignore[union-attr]
             before_img.fill(Qt.white)
         if after_img is None:
-            after_img = QImage(before_img.width(), before_img.height(), QImage.Format_ARGB32)  # type: ignore[union-attr]
+            after_img = QImage(before_img.width(), before_img.height(), DIFF_IMAGE_FORMAT)  # type: ignore[union-attr]
             after_img.fill(Qt.white)
 
         before_img, after_img = normalize_image_sizes(before_img, after_img)
@@ -2283,7 +2710,7 @@ class ItemDiffDialog(QDialog):
 
     @staticmethod
     def _safe_name(value: str) -> str:
-        return re.sub(r"[^A-Za-z0-9._-]+", "_", value)
+        return _SAFE_KEY_RE.sub("_", value)
 
     def _set_images(self, before_img: QImage, after_img: QImage, diff_img: QImage) -> None:
         self._set_image(self.diff_label, diff_img)
@@ -2356,20 +2783,38 @@ class CompareResultDialog(QDialog):
         self.image_status_default_text = image_status_text
         self.image_zoom_mode = "fit"
         self.image_zoom_scale = 1.0
-        self.before_image_raw: QImage | None = None
-        self.after_image_raw: QImage | None = None
-        self.diff_image_raw: QImage | None = None
-        self.image_scrolls: dict[str, QScrollArea] = {}
+        self.before_pixmap_raw: QPixmap | None = None
+        self.after_pixmap_raw: QPixmap | None = None
+        self.diff_pixmap_raw: QPixmap | None = None
+        self._max_w = 0
+        self._max_h = 0
+        self.image_views: dict[str, QGraphicsView] = {}
+        self.image_items: dict[str, QGraphicsPixmapItem] = {}
+        self.image_placeholders: dict[str, QGraphicsTextItem] = {}
+        self._image_tab_keys: list[str] = []
+        self._dirty_views: set[str] = set()
+        self._shown_image_key = "diff"
+        self._all_bars: set[QScrollBar] = set()
+        self._bar_to_scroll: dict[QScrollBar, QGraphicsView] = {}
         self._syncing_scroll = False
+        # Latest source bar per orientation (True = vertical); diagonal drags move both in one tick.
+        self._pending_sync: dict[bool, QScrollBar] = {}
+        self._scroll_sync_timer = QTimer(self)
+        self._scroll_sync_timer.setSingleShot(True)
+        self._scroll_sync_timer.timeout.connect(self._apply_scroll_sync)
         self.image_targets: list[tuple[str, str]] = []
         self.before_svg_map: dict[str, Path] = {}
         self.after_svg_map: dict[str, Path] = {}
-        self._tmp_before_dir_obj: tempfile.TemporaryDirectory[str] | None = None
-        self._tmp_after_dir_obj: tempfile.TemporaryDirectory[str] | None = None
-        self._tmp_svg_before_obj: tempfile.TemporaryDirectory[str] | None = None
-        self._tmp_svg_after_obj: tempfile.TemporaryDirectory[str] | None = None
+        self._tmp_root_obj: tempfile.TemporaryDirectory[str] | None = None
         self.before_root: Path | None = None
         self.after_root: Path | None = None
+        self._render_cache: OrderedDict[str, tuple[QImage, QImage, QImage]] = OrderedDict()
+        self._render_pending: set[str] = set()
+        # Bumped per prepare_image_targets so prefetch results queued from an older run are dropped.
+        self._prefetch_generation = 0
+        self._svg_renderer_cache: OrderedDict[Path, QSvgRenderer] = OrderedDict()
+        self._render_pool = QThreadPool(self)
+        self._render_pool.setMaxThreadCount(2)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(16, 16, 16, 16)
@@ -2473,28 +2918,12 @@ class CompareResultDialog(QDialog):
         self.image_target_list.currentRowChanged.connect(self.on_image_target_selected)
         image_layout.addWidget(self.image_target_list, 1)
 
-        self.before_image_label = QLabel()
-        self.after_image_label = QLabel()
-        self.diff_image_label = QLabel()
-        self.before_image_label.setAlignment(Qt.AlignCenter)
-        self.after_image_label.setAlignment(Qt.AlignCenter)
-        self.diff_image_label.setAlignment(Qt.AlignCenter)
-        self.before_image_label.setText(image_before_text)
-        self.after_image_label.setText(image_after_text)
-        self.diff_image_label.setText(image_diff_text)
         self.image_tabs = QTabWidget()
-        self.image_tabs.addTab(
-            self._wrap_image_label("diff", image_diff_text, self.diff_image_label),
-            image_diff_text,
-        )
-        self.image_tabs.addTab(
-            self._wrap_image_label("before", image_before_text, self.before_image_label),
-            image_before_text,
-        )
-        self.image_tabs.addTab(
-            self._wrap_image_label("after", image_after_text, self.after_image_label),
-            image_after_text,
-        )
+        self.image_tabs.addTab(self._wrap_image_view("diff", image_diff_text), image_diff_text)
+        self.image_tabs.addTab(self._wrap_image_view("before", image_before_text), image_before_text)
+        self.image_tabs.addTab(self._wrap_image_view("after", image_after_text), image_after_text)
+        self._image_tab_keys = ["diff", "before", "after"]
+        self.image_tabs.currentChanged.connect(self.on_image_tab_changed)
         image_layout.addWidget(self.image_tabs, 1)
         tabs.addTab(image_tab, image_title)
         self._connect_image_scroll_sync()
@@ -2520,56 +2949,68 @@ class CompareResultDialog(QDialog):
         actions.addWidget(close_btn)
         root.addLayout(actions)
 
-    def _wrap_image_label(self, key: str, title: str, label: QLabel) -> QWidget:
+    def _wrap_image_view(self, key: str, title: str) -> QWidget:
         wrap = QWidget()
         layout = QVBoxLayout(wrap)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(4)
         title_label = QLabel(title)
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(False)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
-        scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
-        scroll.setWidget(label)
-        self.image_scrolls[key] = scroll
+        scene = QGraphicsScene(self)
+        item = QGraphicsPixmapItem()
+        item.setTransformationMode(Qt.SmoothTransformation)
+        scene.addItem(item)
+        # Empty panes name themselves until the first target is rendered.
+        placeholder = scene.addText(title)
+        view = create_image_view(scene)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.image_views[key] = view
+        self.image_items[key] = item
+        self.image_placeholders[key] = placeholder
         layout.addWidget(title_label)
-        layout.addWidget(scroll, 1)
+        layout.addWidget(view, 1)
         return wrap
 
     def _connect_image_scroll_sync(self) -> None:
-        for scroll in self.image_scrolls.values():
-            scroll.horizontalScrollBar().valueChanged.connect(self.on_image_scroll_changed)
-            scroll.verticalScrollBar().valueChanged.connect(self.on_image_scroll_changed)
+        self._all_bars.clear()
+        self._bar_to_scroll.clear()
+        for view in self.image_views.values():
+            for bar in (view.horizontalScrollBar(), view.verticalScrollBar()):
+                self._all_bars.add(bar)
+                self._bar_to_scroll[bar] = view
+                bar.valueChanged.connect(self.on_image_scroll_changed)
 
     def on_image_scroll_changed(self, _: int) -> None:
         if self._syncing_scroll:
             return
 
         source_bar = self.sender()
-        if source_bar is None:
+        if source_bar not in self._all_bars:
             return
 
-        bars = []
-        for scroll in self.image_scrolls.values():
-            bars.append(scroll.horizontalScrollBar())
-            bars.append(scroll.verticalScrollBar())
-        if source_bar not in bars:
-            return
+        # Coalesce bursts of scroll signals into one fan-out per event-loop tick.
+        self._pending_sync[source_bar.orientation() == Qt.Vertical] = source_bar
+        self._scroll_sync_timer.start(0)
+
+    def _apply_scroll_sync(self) -> None:
+        pending = self._pending_sync
+        self._pending_sync = {}
 
         self._syncing_scroll = True
         try:
-            source_max = source_bar.maximum()
-            source_value = source_bar.value()
-            ratio = 0.0 if source_max <= 0 else source_value / source_max
-            source_is_vertical = source_bar.orientation() == Qt.Vertical
-
-            for scroll in self.image_scrolls.values():
-                target_bar = scroll.verticalScrollBar() if source_is_vertical else scroll.horizontalScrollBar()
-                if target_bar is source_bar:
-                    continue
-                target_max = target_bar.maximum()
-                target_value = int(round(ratio * target_max)) if target_max > 0 else 0
-                target_bar.setValue(target_value)
+            for source_is_vertical, source_bar in pending.items():
+                source_scroll = self._bar_to_scroll.get(source_bar)
+                source_value = source_bar.value()
+                source_max = source_bar.maximum()
+                for view in self.image_views.values():
+                    if view is source_scroll:
+                        continue
+                    target_bar = view.verticalScrollBar() if source_is_vertical else view.horizontalScrollBar()
+                    target_max = target_bar.maximum()
+                    if source_max <= 0 or target_max <= 0:
+                        target_bar.setValue(0)
+                        continue
+                    target_bar.setValue((source_value * target_max) // source_max)
         finally:
             self._syncing_scroll = False
 
@@ -2587,33 +3028,39 @@ class CompareResultDialog(QDialog):
     def _decode_bytes(self, data: bytes | None) -> str:
         if data is None:
             return self.visual_empty_text
-        try:
-            return data.decode("utf-8")
-        except UnicodeDecodeError:
-            return data.decode("utf-8", errors="replace")
+        return data.decode("utf-8", errors="replace")
 
     def prepare_image_targets(self) -> None:
+        self._cleanup_temp_dirs()
+        self._prefetch_generation += 1
         self.image_target_list.clear()
         self.image_targets.clear()
         self.before_svg_map.clear()
         self.after_svg_map.clear()
-        self._cleanup_temp_dirs()
+        self._render_cache.clear()
+        self._svg_renderer_cache.clear()
 
         try:
-            self._tmp_before_dir_obj = tempfile.TemporaryDirectory(prefix="ksnap_before_")
-            self._tmp_after_dir_obj = tempfile.TemporaryDirectory(prefix="ksnap_after_")
-            self._tmp_svg_before_obj = tempfile.TemporaryDirectory(prefix="ksnap_svg_before_")
-            self._tmp_svg_after_obj = tempfile.TemporaryDirectory(prefix="ksnap_svg_after_")
-
-            before_root = Path(self._tmp_before_dir_obj.name)
-            after_root = Path(self._tmp_after_dir_obj.name)
-            out_before = Path(self._tmp_svg_before_obj.name)
-            out_after = Path(self._tmp_svg_after_obj.name)
+            self._tmp_root_obj = tempfile.TemporaryDirectory(prefix="ksnap_", ignore_cleanup_errors=True)
+            tmp_root = Path(self._tmp_root_obj.name)
+            before_root = tmp_root / "before"
+            after_root = tmp_root / "after"
+            out_before = tmp_root / "svg_before"
+            out_after = tmp_root / "svg_after"
+            for path in (before_root, after_root, out_before, out_after):
+                path.mkdir(parents=True, exist_ok=True)
             self.before_root = before_root
             self.after_root = after_root
 
-            write_file_map(before_root, self.before_map)
-            write_file_map(after_root, self.after_map)
+            # Both trees are independent; file writes release the GIL, so overlap them.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(
+                    executor.map(
+                        write_file_map,
+                        (before_root, after_root),
+                        (self.before_map, self.after_map),
+                    )
+                )
 
             self.before_svg_map.update(self._export_side_svgs(before_root, out_before, []))
             self.after_svg_map.update(self._export_side_svgs(after_root, out_after, []))
@@ -2629,7 +3076,8 @@ class CompareResultDialog(QDialog):
             self.before_svg_map.update(self._export_side_svgs(before_root, out_before, layers))
             self.after_svg_map.update(self._export_side_svgs(after_root, out_after, layers))
 
-            all_keys = sorted(set(self.before_svg_map.keys()) | set(self.after_svg_map.keys()))
+            # Dict key views union directly into a single set.
+            all_keys = sorted(self.before_svg_map.keys() | self.after_svg_map.keys())
             for key in all_keys:
                 kind, rel = key.split("|", 1)
                 if kind == "pcb" and rel == "__board__":
@@ -2653,72 +3101,143 @@ class CompareResultDialog(QDialog):
             self.image_status.setStyleSheet("color: #b00020;")
 
     def _export_side_svgs(self, source_root: Path, out_root: Path, layers: list[str]) -> dict[str, Path]:
-        result: dict[str, Path] = {}
+        return asyncio.run(self._export_side_svgs_async(source_root, out_root, layers))
+
+    async def _export_side_svgs_async(
+        self,
+        source_root: Path,
+        out_root: Path,
+        layers: list[str],
+    ) -> dict[str, Path]:
+        # kicad-cli runs are independent, so overlap them; the cap keeps memory use bounded.
+        semaphore = asyncio.Semaphore(min(MAX_PARALLEL_EXPORTS, os.cpu_count() or 1))
+
+        async def export_sch(sch_src: Path, sch_out: Path) -> dict[str, Path]:
+            svgs = await export_svg_bundle_with_kicad_cli_async(
+                self.cli_path, sch_src, sch_out, "sch", semaphore=semaphore
+            )
+            return {f"sch|{svg.relative_to(sch_out).as_posix()}": svg for svg in svgs}
+
+        async def export_board(pcb_src: Path, board_out: Path) -> dict[str, Path]:
+            pcb_svgs = await export_svg_bundle_with_kicad_cli_async(
+                self.cli_path, pcb_src, board_out, "pcb", semaphore=semaphore
+            )
+            found = {f"pcb|{svg.relative_to(board_out).as_posix()}": svg for svg in pcb_svgs}
+            # Also expose a stable board-level target (first exported SVG as primary).
+            if pcb_svgs:
+                found["pcb|__board__"] = pcb_svgs[0]
+            return found
+
+        async def export_layer(pcb_src: Path, layer: str, layer_dir: Path) -> dict[str, Path]:
+            layer_svgs = await export_svg_bundle_with_kicad_cli_async(
+                self.cli_path, pcb_src, layer_dir, "pcb", pcb_layers=layer, semaphore=semaphore
+            )
+            return {f"pcb|layer:{layer}": layer_svgs[0]} if layer_svgs else {}
+
+        jobs = []
         sch_src = first_matching_file(source_root, ".kicad_sch")
         if sch_src is not None:
             sch_out = out_root / "sch"
             sch_out.mkdir(parents=True, exist_ok=True)
-            try:
-                for svg in export_svg_bundle_with_kicad_cli(self.cli_path, sch_src, sch_out, "sch"):
-                    rel = svg.relative_to(sch_out).as_posix()
-                    result[f"sch|{rel}"] = svg
-            except Exception:
-                # Keep other targets available even if schematic export fails.
-                pass
+            jobs.append(export_sch(sch_src, sch_out))
 
         pcb_src = first_matching_file(source_root, ".kicad_pcb")
         if pcb_src is not None:
             pcb_out = out_root / "pcb"
-            pcb_out.mkdir(parents=True, exist_ok=True)
-            try:
-                pcb_svgs = export_svg_bundle_with_kicad_cli(self.cli_path, pcb_src, pcb_out, "pcb")
-                for svg in pcb_svgs:
-                    rel = svg.relative_to(pcb_out).as_posix()
-                    result[f"pcb|{rel}"] = svg
-                # Also expose a stable board-level target (first exported SVG as primary).
-                if pcb_svgs:
-                    result["pcb|__board__"] = pcb_svgs[0]
-            except Exception:
-                # Keep other targets available even if PCB export fails.
-                pass
-
-            # Layer-specific exports
+            # Board and layer exports run concurrently, so each gets its own directory.
+            board_out = pcb_out / "board"
+            board_out.mkdir(parents=True, exist_ok=True)
+            jobs.append(export_board(pcb_src, board_out))
             for layer in layers:
                 layer_dir = pcb_out / f"layer_{layer.replace('.', '_')}"
                 layer_dir.mkdir(parents=True, exist_ok=True)
-                try:
-                    layer_svgs = export_svg_bundle_with_kicad_cli(
-                        self.cli_path,
-                        pcb_src,
-                        layer_dir,
-                        "pcb",
-                        pcb_layers=layer,
-                    )
-                    if layer_svgs:
-                        result[f"pcb|layer:{layer}"] = layer_svgs[0]
-                except Exception:
-                    continue
+                jobs.append(export_layer(pcb_src, layer, layer_dir))
+
+        result: dict[str, Path] = {}
+        for found in await asyncio.gather(*jobs, return_exceptions=True):
+            # Keep other targets available even if one export fails.
+            if isinstance(found, dict):
+                result.update(found)
         return result
 
     def on_image_target_selected(self, row: int) -> None:
         if row < 0 or row >= len(self.image_targets):
             return
         key = self.image_targets[row][0]
-        try:
-            before_img, after_img, diff_img = self._build_image_diff_for_target(key)
-        except Exception as exc:
-            self.image_status.setText(str(exc))
-            self.image_status.setStyleSheet("color: #b00020;")
-            return
-
-        self.image_status.setText("OK")
-        self.image_status.setStyleSheet("color: #2b7a0b;")
-        self.before_image_raw = before_img
-        self.after_image_raw = after_img
-        self.diff_image_raw = diff_img
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            self._render_cache.move_to_end(key)
+            before_img, after_img, diff_img = cached
+        else:
+            try:
+                before_img, after_img, diff_img = self._build_image_diff_for_target(key)
+            except Exception as exc:
+                self.image_status.setText(str(exc))
+                self.image_status.setStyleSheet("color: #b00020;")
+                return
+            self._store_rendered_target(key, (before_img, after_img, diff_img))
+        self._prefetch_adjacent_targets(row)
+
+        if key not in self.before_svg_map or key not in self.after_svg_map:
+            self.image_status.setText(self.image_missing_side_text)
+            self.image_status.setStyleSheet("color: #9a6700;")
+        else:
+            self.image_status.setText("OK")
+            self.image_status.setStyleSheet("color: #2b7a0b;")
+        # Upload once per selection; zoom and pan only change the view transforms.
+        self.before_pixmap_raw = QPixmap.fromImage(before_img)
+        self.after_pixmap_raw = QPixmap.fromImage(after_img)
+        self.diff_pixmap_raw = QPixmap.fromImage(diff_img)
+        self._max_w = max(before_img.width(), after_img.width(), diff_img.width())
+        self._max_h = max(before_img.height(), after_img.height(), diff_img.height())
+        scene_rect = QRectF(0, 0, self._max_w, self._max_h)
+        for image_key, item in self.image_items.items():
+            item.setPixmap(self._raw_pixmap_for_key(image_key) or QPixmap())
+            item.scene().setSceneRect(scene_rect)
+            self.image_placeholders[image_key].hide()
         self.image_zoom_scale = 1.0
         self.zoom_fit_images()
 
+    def _prefetch_adjacent_targets(self, row: int) -> None:
+        for neighbor in (row + 1, row - 1):
+            if neighbor < 0 or neighbor >= len(self.image_targets):
+                continue
+            key = self.image_targets[neighbor][0]
+            if key in self._render_cache or key in self._render_pending:
+                continue
+            self._render_pending.add(key)
+            # Worker threads parse their own renderers; the renderer cache is GUI-thread only.
+            task = BackgroundTask(
+                f"{self._prefetch_generation}:{key}",
+                lambda key=key: self._build_image_diff_for_target(key, use_renderer_cache=False),
+            )
+            task.signals.finished.connect(self._on_prefetch_finished)
+            task.signals.failed.connect(self._on_prefetch_failed)
+            self._render_pool.start(task)
+
+    def _prefetch_current_key(self, task_key: str) -> str | None:
+        generation, _, key = task_key.partition(":")
+        return key if generation == str(self._prefetch_generation) else None
+
+    def _on_prefetch_finished(self, task_key: str, images: object) -> None:
+        key = self._prefetch_current_key(task_key)
+        if key is None:
+            return
+        self._render_pending.discard(key)
+        if isinstance(images, tuple):
+            self._store_rendered_target(key, images)
+
+    def _on_prefetch_failed(self, task_key: str, _message: str) -> None:
+        key = self._prefetch_current_key(task_key)
+        if key is not None:
+            self._render_pending.discard(key)
+
+    def _store_rendered_target(self, key: str, images: tuple[QImage, QImage, QImage]) -> None:
+        self._render_cache[key] = images
+        self._render_cache.move_to_end(key)
+        while len(self._render_cache) > RESULT_RENDER_CACHE_SIZE:
+            self._render_cache.popitem(last=False)
+
     def _target_has_diff(self, key: str) -> bool:
         before_svg = self.before_svg_map.get(key)
         after_svg = self.after_svg_map.get(key)
@@ -2729,27 +3248,49 @@ class CompareResultDialog(QDialog):
         except OSError:
             return True
 
-    def _build_image_diff_for_target(self, target_key: str) -> tuple[QImage, QImage, QImage]:
+    def _get_renderer(self, svg_path: Path) -> QSvgRenderer:
+        renderer = self._svg_renderer_cache.get(svg_path)
+        if renderer is not None:
+            self._svg_renderer_cache.move_to_end(svg_path)
+            return renderer
+        renderer = load_svg_renderer(svg_path)
+        self._svg_renderer_cache[svg_path] = renderer
+        while len(self._svg_renderer_cache) > SVG_RENDERER_CACHE_SIZE:
+            self._svg_renderer_cache.popitem(last=False)
+        return renderer
+
+    def _rasterize_svg(self, svg_path: Path | None, use_renderer_cache: bool) -> QImage | None:
+        if svg_path is None:
+            return None
+        if not use_renderer_cache:
+            return render_svg_to_image(svg_path)
+        return render_svg_renderer_to_image(self._get_renderer(svg_path), svg_path.name)
+
+    def _build_image_diff_for_target(
+        self,
+        target_key: str,
+        use_renderer_cache: bool = True,
+    ) -> tuple[QImage, QImage, QImage]:
         before_svg = self.before_svg_map.get(target_key)
         after_svg = self.after_svg_map.get(target_key)
         if before_svg is None and after_svg is None:
             raise RuntimeError(self.image_not_available_text)
 
-        before_img = render_svg_to_image(before_svg) if before_svg is not None else None
-        after_img = render_svg_to_image(after_svg) if after_svg is not None else None
+        before_img = self._rasterize_svg(before_svg, use_renderer_cache)
+        after_img = self._rasterize_svg(after_svg, use_renderer_cache)
 
         if before_img is None and after_img is None:
             raise RuntimeError(self.image_not_available_text)
+        if before_img is not None:
+            before_img = before_img.convertToFormat(DIFF_IMAGE_FORMAT)
+        if after_img is not None:
+            after_img = after_img.convertToFormat(DIFF_IMAGE_FORMAT)
         if before_img is None:
-            before_img = QImage(after_img.width(), after_img.height(), QImage.Format_ARGB32)  # type: ignore[union-attr]
+            before_img = QImage(after_img.width(), after_img.height(), DIFF_IMAGE_FORMAT)  # type: ignore[union-attr]
             before_img.fill(Qt.white)
-            self.image_status.setText(self.image_missing_side_text)
-            self.image_status.setStyleSheet("color: #9a6700;")
         if after_img is None:
-            after_img = QImage(before_img.width(), before_img.height(), QImage.Format_ARGB32)  # type: ignore[union-attr]
+            after_img = QImage(before_img.width(), before_img.height(), DIFF_IMAGE_FORMAT)  # type: ignore[union-attr]
             after_img.fill(Qt.white)
-            self.image_status.setText(self.image_missing_side_text)
-            self.image_status.setStyleSheet("color: #9a6700;")
 
         before_img, after_img = normalize_image_sizes(before_img, after_img)
         diff_img = make_pixel_diff_image(before_img, after_img)
@@ -2757,84 +3298,87 @@ class CompareResultDialog(QDialog):
 
     def zoom_fit_images(self) -> None:
         self.image_zoom_mode = "fit"
-        self._render_image_labels()
+        self._apply_image_zoom()
 
     def zoom_in_images(self) -> None:
         self.image_zoom_mode = "manual"
         self.image_zoom_scale = min(self.image_zoom_scale * 1.25, 8.0)
-        self._render_image_labels()
+        self._apply_image_zoom()
 
     def zoom_out_images(self) -> None:
         self.image_zoom_mode = "manual"
         self.image_zoom_scale = max(self.image_zoom_scale / 1.25, 0.1)
-        self._render_image_labels()
+        self._apply_image_zoom()
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
         if self.image_zoom_mode == "fit":
-            self._render_image_labels()
-
-    def _render_image_labels(self) -> None:
-        common_fit_scale = None
-        if self.image_zoom_mode == "fit":
-            common_fit_scale = self._compute_common_fit_scale()
-        self._set_image_for_key("before", self.before_image_label, self.before_image_raw, common_fit_scale)
-        self._set_image_for_key("after", self.after_image_label, self.after_image_raw, common_fit_scale)
-        self._set_image_for_key("diff", self.diff_image_label, self.diff_image_raw, common_fit_scale)
-
-    def _compute_common_fit_scale(self) -> float:
-        images = [img for img in [self.before_image_raw, self.after_image_raw, self.diff_image_raw] if img is not None]
-        if not images:
-            return 1.0
-        max_w = max(img.width() for img in images)
-        max_h = max(img.height() for img in images)
-        if max_w <= 0 or max_h <= 0:
-            return 1.0
+            self._apply_image_zoom()
 
-        scroll = self.image_scrolls.get("diff") or next(iter(self.image_scrolls.values()), None)
-        if scroll is None:
-            return 1.0
-        vp = scroll.viewport().size()
-        avail_w = max(1, vp.width())
-        avail_h = max(1, vp.height())
-        scale = min(avail_w / max_w, avail_h / max_h)
-        return max(0.05, min(scale, 8.0))
+    def _current_image_key(self) -> str:
+        index = self.image_tabs.currentIndex()
+        if 0 <= index < len(self._image_tab_keys):
+            return self._image_tab_keys[index]
+        return "diff"
 
-    def _set_image_for_key(
-        self,
-        key: str,
-        label: QLabel,
-        image: QImage | None,
-        common_fit_scale: float | None = None,
-    ) -> None:
-        if image is None:
+    def _raw_pixmap_for_key(self, key: str) -> QPixmap | None:
+        if key == "before":
+            return self.before_pixmap_raw
+        if key == "after":
+            return self.after_pixmap_raw
+        return self.diff_pixmap_raw
+
+    def on_image_tab_changed(self, _: int) -> None:
+        key = self._current_image_key()
+        previous = self.image_views.get(self._shown_image_key)
+        self._shown_image_key = key
+        if key in self._dirty_views:
+            self._apply_view_zoom(key)
+        view = self.image_views[key]
+        if previous is None or previous is view:
             return
-        pixmap = QPixmap.fromImage(image)
+        # Hidden views recompute their scroll ranges when shown; carry the position over.
+        self._syncing_scroll = True
+        try:
+            for source_bar, target_bar in (
+                (previous.horizontalScrollBar(), view.horizontalScrollBar()),
+                (previous.verticalScrollBar(), view.verticalScrollBar()),
+            ):
+                source_max = source_bar.maximum()
+                target_max = target_bar.maximum()
+                if source_max > 0 and target_max > 0:
+                    target_bar.setValue((source_bar.value() * target_max) // source_max)
+        finally:
+            self._syncing_scroll = False
+
+    def _apply_image_zoom(self) -> None:
+        # Hidden views have stale viewport sizes, so they are fitted when their tab is shown.
+        current = self._current_image_key()
+        self._dirty_views = {key for key in self._image_tab_keys if key != current}
+        self._apply_view_zoom(current)
+
+    def _apply_view_zoom(self, key: str) -> None:
+        self._dirty_views.discard(key)
+        view = self.image_views[key]
         if self.image_zoom_mode == "fit":
-            scale = common_fit_scale if common_fit_scale is not None else 1.0
-            width = max(1, int(pixmap.width() * scale))
-            height = max(1, int(pixmap.height() * scale))
-            pixmap = pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            if self._max_w > 0 and self._max_h > 0:
+                view.fitInView(view.sceneRect(), Qt.KeepAspectRatio)
+                # Same bounds the label-based fit used; fitInView alone would scale without limit.
+                scale = view.transform().m11()
+                clamped = max(0.05, min(scale, 8.0))
+                if clamped != scale:
+                    view.setTransform(QTransform.fromScale(clamped, clamped))
         else:
-            width = max(1, int(pixmap.width() * self.image_zoom_scale))
-            height = max(1, int(pixmap.height() * self.image_zoom_scale))
-            pixmap = pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        label.setPixmap(pixmap)
-        label.resize(pixmap.size())
+            view.setTransform(QTransform.fromScale(self.image_zoom_scale, self.image_zoom_scale))
 
     def _cleanup_temp_dirs(self) -> None:
-        for obj in [
-            self._tmp_before_dir_obj,
-            self._tmp_after_dir_obj,
-            self._tmp_svg_before_obj,
-            self._tmp_svg_after_obj,
-        ]:
-            if obj is not None:
-                obj.cleanup()
-        self._tmp_before_dir_obj = None
-        self._tmp_after_dir_obj = None
-        self._tmp_svg_before_obj = None
-        self._tmp_svg_after_obj = None
+        # Background rasterization reads exported SVGs; let it finish before removing them.
+        self._render_pool.clear()
+        self._render_pool.waitForDone()
+        self._render_pending.clear()
+        if self._tmp_root_obj is not None:
+            self._tmp_root_obj.cleanup()
+        self._tmp_root_obj = None
 
     def closeEvent(self, event) -> None:
         self._cleanup_temp_dirs()
@@ -2842,12 +3386,79 @@ class CompareResultDialog(QDialog):
 
 
 class MainWindow(QMainWindow):
+    compare_status_changed = Signal()
+
+    # (widget attribute, setter, translation key); widgets not built yet are skipped.
+    _TRANSLATABLE: tuple[tuple[str, str, str], ...] = (
+        ("title", "setText", "title"),
+        ("subtitle", "setText", "subtitle"),
+        ("language_label", "setText", "language"),
+        ("cli_box", "setTitle", "group_path"),
+        ("path_label", "setText", "cli_path"),
+        ("path_input", "setPlaceholderText", "cli_placeholder"),
+        ("browse_btn", "setText", "browse"),
+        ("detect_btn", "setText", "auto_detect"),
+        ("git_label", "setText", "git_path"),
+        ("git_refresh_btn", "setText", "git_refresh"),
+        ("project_box", "setTitle", "group_project"),
+        ("project_hint", "setText", "project_hint"),
+        ("open_btn", "setText", "open_project"),
+        ("remove_btn", "setText", "remove_project"),
+        ("next_box", "setTitle", "group_next"),
+        ("next_hint", "setText", "next_hint"),
+        ("proceed_btn", "setText", "continue"),
+        ("snapshot_title", "setText", "snapshot_window_title"),
+        ("snapshot_compare_btn", "setText", "snapshot_open_compare"),
+        ("snapshot_back_btn", "setText", "snapshot_back"),
+        ("snapshot_filter_label", "setText", "compare_filter"),
+        ("snapshot_filter_both", "setText", "compare_filter_both"),
+        ("snapshot_filter_backup", "setText", "compare_filter_backup"),
+        ("snapshot_filter_git", "setText", "compare_filter_git"),
+        ("snapshot_limit_label", "setText", "compare_limit"),
+        ("snapshot_refresh_btn", "setText", "compare_refresh"),
+        ("snapshot_backup_memo_label", "setText", "compare_backup_memo"),
+        ("snapshot_backup_memo_input", "setPlaceholderText", "compare_backup_memo_placeholder"),
+        ("snapshot_create_backup_btn", "setText", "compare_create_backup"),
+        ("snapshot_from_label", "setText", "compare_from"),
+        ("snapshot_to_label", "setText", "compare_to"),
+        ("compare_title", "setText", "compare_window_title"),
+        ("compare_source_label", "setText", "compare_filter"),
+        ("compare_source_both", "setText", "compare_filter_both"),
+        ("compare_source_backup", "setText", "compare_filter_backup"),
+        ("compare_source_git", "setText", "compare_filter_git"),
+        ("compare_limit_label", "setText", "compare_limit"),
+        ("compare_refresh_btn", "setText", "compare_refresh"),
+        ("compare_backup_memo_label", "setText", "compare_backup_memo"),
+        ("compare_backup_memo_input", "setPlaceholderText", "compare_backup_memo_placeholder"),
+        ("compare_create_backup_btn", "setText", "compare_create_backup"),
+        ("compare_from_label2", "setText", "compare_from"),
+        ("compare_to_label2", "setText", "compare_to"),
+        ("compare_run_btn2", "setText", "compare_run"),
+        ("compare_back_btn", "setText", "compare_back"),
+        ("compare_items_label", "setText", "compare_image_target"),
+        ("compare_preview_title", "setText", "compare_image_title"),
+        ("compare_zoom_out_btn", "setText", "compare_image_zoom_out"),
+        ("compare_zoom_in_btn", "setText", "compare_image_zoom_in"),
+        ("compare_zoom_fit_btn", "setText", "compare_image_zoom_fit"),
+        ("compare_render_scale_label", "setText", "compare_image_render_scale"),
+    )
+
     def __init__(self) -> None:
         super().__init__()
 
         self.settings_store = SettingsStore()
         self.settings = self.settings_store.load()
+        # Recent projects in list order, kept alongside recent_list so saves never read widget rows.
+        self._recent_cache: list[str] = []
+        # Bursts of setting changes share one disk write; closeEvent flushes any pending save.
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(200)
+        self._settings_save_timer.timeout.connect(self._write_settings)
+        # Validation warnings are built on first use and reused; _cache_warning_texts retranslates them.
+        self._warning_boxes: dict[str, QMessageBox] = {}
         self.language = self.resolve_initial_language()
+        self._cache_warning_texts()
         self.compare_render_scale = self.resolve_compare_render_scale()
 
         self.cli_candidate: CliCandidate | None = None
@@ -2871,10 +3482,7 @@ class MainWindow(QMainWindow):
 
         header_row = QHBoxLayout()
         self.title = QLabel("")
-        title_font = QFont()
-        title_font.setPointSize(20)
-        title_font.setBold(True)
-        self.title.setFont(title_font)
+        self.title.setFont(heading_font(20))
 
         header_row.addWidget(self.title)
         header_row.addStretch(1)
@@ -3043,9 +3651,14 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event) -> None:
         self._cleanup_compare_temp_dirs()
+        if self._compare_render_cache_obj is not None:
+            self._compare_render_cache_obj.cleanup()
+            self._compare_render_cache_obj = None
         self.settings["window_width"] = self.width()
         self.settings["window_height"] = self.height()
         self.save_settings()
+        self._settings_save_timer.stop()
+        self._write_settings()
         super().closeEvent(event)
 
     def resizeEvent(self, event) -> None:
@@ -3060,10 +3673,7 @@ class MainWindow(QMainWindow):
         layout.setSpacing(12)
 
         self.snapshot_title = QLabel(self.t("snapshot_window_title"))
-        font = QFont()
-        font.setPointSize(18)
-        font.setBold(True)
-        self.snapshot_title.setFont(font)
+        self.snapshot_title.setFont(heading_font(18))
         layout.addWidget(self.snapshot_title)
 
         self.snapshot_project_label = QLabel("")
@@ -3094,7 +3704,7 @@ class MainWindow(QMainWindow):
         self.snapshot_limit_combo.currentIndexChanged.connect(self.on_snapshot_limit_changed)
 
         self.snapshot_refresh_btn = QPushButton(self.t("compare_refresh"))
-        self.snapshot_refresh_btn.clicked.connect(self.refresh_snapshot_timeline)
+        self.snapshot_refresh_btn.clicked.connect(self.on_snapshot_refresh_clicked)
 
         self.snapshot_backup_memo_label = QLabel(self.t("compare_backup_memo"))
         self.snapshot_backup_memo_input = QLineEdit()
@@ -3154,7 +3764,12 @@ class MainWindow(QMainWindow):
 
         self.snapshot_active_project: Path | None = None
         self.snapshot_items_all: list[SnapshotItem] = []
+        # Merged backup/git timeline shared by the snapshot and compare pages, keyed by (project, git, limit).
+        self._timeline_cache_key: tuple[Path, str | None, int] | None = None
+        self._timeline_cache: list[SnapshotItem] = []
         self.snapshot_items_filtered: list[SnapshotItem] = []
+        self._snapshot_items_by_id: dict[str, SnapshotItem] = {}
+        self._compare_items_by_id: dict[str, SnapshotItem] = {}
         self.snapshot_filter_group.blockSignals(True)
         self.snapshot_filter_both.setChecked(True)
         self.snapshot_filter_group.blockSignals(False)
@@ -3167,10 +3782,7 @@ class MainWindow(QMainWindow):
         layout.setSpacing(10)
 
         self.compare_title = QLabel(self.t("compare_window_title"))
-        font = QFont()
-        font.setPointSize(18)
-        font.setBold(True)
-        self.compare_title.setFont(font)
+        self.compare_title.setFont(heading_font(18))
         layout.addWidget(self.compare_title)
 
         content_split = QSplitter(Qt.Horizontal)
@@ -3181,7 +3793,9 @@ class MainWindow(QMainWindow):
         left_layout.setSpacing(6)
         self.compare_items_label = QLabel(self.t("compare_image_target"))
         left_layout.addWidget(self.compare_items_label)
-        self.compare_item_list = QListWidget()
+        self.compare_target_model = CompareTargetModel(self._format_compare_list_label, self)
+        self.compare_item_list = CompareTargetListView()
+        self.compare_item_list.setModel(self.compare_target_model)
         self.compare_item_list.currentRowChanged.connect(self.on_compare_item_selected)
         left_layout.addWidget(self.compare_item_list, 1)
 
@@ -3219,12 +3833,17 @@ class MainWindow(QMainWindow):
         self.compare_auto_cycle_timer = QTimer(self)
         self.compare_auto_cycle_timer.setInterval(800)
         self.compare_auto_cycle_timer.timeout.connect(self._advance_compare_auto_image)
+        # Rapid zoom clicks or key repeats collapse into one rescale.
+        self._compare_zoom_timer = QTimer(self)
+        self._compare_zoom_timer.setSingleShot(True)
+        self._compare_zoom_timer.setInterval(75)
+        self._compare_zoom_timer.timeout.connect(self._render_compare_image_labels)
         self.compare_image_tabs = QTabWidget()
         self.compare_image_tabs.currentChanged.connect(self.on_compare_image_tab_changed)
-        self.compare_diff_image_label = QLabel()
-        self.compare_before_image_label = QLabel()
-        self.compare_after_image_label = QLabel()
-        self.compare_auto_image_label = QLabel()
+        self.compare_diff_image_label = ScaledImageLabel()
+        self.compare_before_image_label = ScaledImageLabel()
+        self.compare_after_image_label = ScaledImageLabel()
+        self.compare_auto_image_label = ScaledImageLabel()
         for label in [self.compare_diff_image_label, self.compare_before_image_label, self.compare_after_image_label, self.compare_auto_image_label]:
             label.setAlignment(Qt.AlignCenter)
             label.setText(self.t("compare_image_not_available"))
@@ -3248,19 +3867,41 @@ class MainWindow(QMainWindow):
         self.compare_from_id: str | None = None
         self.compare_to_id: str | None = None
         self._compare_pending_from_id: str | None = None
+        # Bumped per compare start; a map load finishing after the user moved on is dropped.
+        self._compare_map_load_generation = 0
+        # Same idea for run_compare; a load is in flight while the key is not None.
+        self._run_compare_generation = 0
+        self._run_compare_inflight: str | None = None
         self._compare_pending_to_id: str | None = None
         self.compare_before_map: dict[str, bytes] = {}
         self.compare_after_map: dict[str, bytes] = {}
         self.compare_targets: list[dict[str, str | None]] = []
-        self.compare_target_labels: list[str] = []
-        self.compare_target_status: dict[str, str] = {}
+        # Parallel to compare_targets; built once per populate so hot paths index instead of formatting.
+        self.compare_target_keys: list[str] = []
+        # Rows touched by status writes; workers only put, the GUI thread drains.
+        self._compare_changed_rows: queue.SimpleQueue[int] = queue.SimpleQueue()
         self.compare_render_cache: dict[str, tuple[QImage, QImage, QImage]] = {}
+        self._pcb_layers_cache: dict[tuple[str, str], list[str]] = {}
+        self._compare_identical_paths: set[str] = set()
+        self._compare_deferred_files: dict[Path, dict[str, bytes]] = {}
+        # Set once the deferred files of the current session are on disk, whichever worker wrote them.
+        self._compare_deferred_written = threading.Event()
+        self._compare_layer_svgs: dict[str, dict[str, Path]] = {}
         self.compare_before_image_raw: QImage | None = None
         self.compare_after_image_raw: QImage | None = None
         self.compare_diff_image_raw: QImage | None = None
+        # Unscaled pixmaps converted once per preview image and reused for every rescale.
+        self._compare_raw_pixmaps: dict[str, QPixmap] = {}
+        # Last fit-scale inputs (viewport and image sizes) and result; scroll/tab flushes rarely change them.
+        self._compare_fit_cache_key: tuple[int, int, int, int] | None = None
+        self._compare_fit_cache_value = 1.0
+        self._compare_preview_reduced = False
         self.compare_zoom_mode = "fit"
         self.compare_zoom_scale = 1.0
         self._compare_syncing_scroll = False
+        # Latest moved bar per orientation; propagation is flushed once per event-loop pass.
+        self._compare_scroll_pending = False
+        self._compare_scroll_latest: dict[bool, QScrollBar] = {}
         self._compare_scroll_ratio_x = 0.0
         self._compare_scroll_ratio_y = 0.0
         self.compare_before_root: Path | None = None
@@ -3268,15 +3909,30 @@ class MainWindow(QMainWindow):
         self.compare_render_root: Path | None = None
         self._compare_tmp_before_obj: tempfile.TemporaryDirectory[str] | None = None
         self._compare_tmp_after_obj: tempfile.TemporaryDirectory[str] | None = None
-        self._compare_tmp_render_obj: tempfile.TemporaryDirectory[str] | None = None
-        self._compare_precache_thread: threading.Thread | None = None
+        # Lives for the whole window so reopening the same compare reuses its renders.
+        self._compare_render_cache_obj: tempfile.TemporaryDirectory[str] | None = None
+        # Each executor with the futures it was given; kept until cleanup has waited on them.
+        self._compare_precache_executors: dict[ThreadPoolExecutor, list[Future]] = {}
+        self._compare_precache_futures: list[Future] = []
+        self._compare_precache_generation = 0
         self._compare_precache_stop = threading.Event()
         self._compare_render_lock = threading.Lock()
+        self._compare_target_locks: dict[str, threading.Lock] = {}
+        # Guards status read-modify-write transitions only; plain reads go straight to the model.
         self._compare_status_lock = threading.Lock()
-        self.compare_precache_active = False
+        self._compare_render_pool = QThreadPool(self)
+        self._compare_render_inflight: dict[str, str] = {}
+        self._compare_qimage_cache: OrderedDict[str, tuple[QImage, QImage, QImage]] = OrderedDict()
+        # PNG copies are only a fallback; write them one at a time away from the render path.
+        self._compare_png_pool = QThreadPool(self)
+        self._compare_png_pool.setMaxThreadCount(1)
+        # Status writes from workers mark the list dirty once; a short single-shot timer coalesces repaints.
+        self._compare_list_dirty = False
         self.compare_status_refresh_timer = QTimer(self)
-        self.compare_status_refresh_timer.setInterval(300)
+        self.compare_status_refresh_timer.setSingleShot(True)
+        self.compare_status_refresh_timer.setInterval(50)
         self.compare_status_refresh_timer.timeout.connect(self._refresh_compare_item_list_labels)
+        self.compare_status_changed.connect(self._schedule_compare_list_refresh, Qt.QueuedConnection)
 
         actions = QHBoxLayout()
         actions.addStretch(1)
@@ -3308,6 +3964,8 @@ class MainWindow(QMainWindow):
 
     def show_snapshot_page(self, project: str) -> None:
         self.snapshot_active_project = Path(project)
+        # Opening a project always rescans; returning from the compare page reuses the cached timeline.
+        self._invalidate_timeline_cache()
         self.snapshot_project_label.setText(self.t("snapshot_selected_project", project=project))
         mode = self.settings.get("compare_filter")
         self.snapshot_filter_group.blockSignals(True)
@@ -3332,10 +3990,10 @@ class MainWindow(QMainWindow):
 
     def open_compare_from_snapshot(self) -> None:
         if self.snapshot_active_project is None:
-            QMessageBox.warning(self, self.t("warning_project_title"), self.t("warning_project_text"))
+            self._show_warning("project")
             return
         if self.cli_candidate is None:
-            QMessageBox.warning(self, self.t("warning_cli_title"), self.t("warning_cli_text"))
+            self._show_warning("cli")
             return
         if self.snapshot_from_combo.count() < 1 or self.snapshot_to_combo.count() < 1:
             QMessageBox.warning(self, self.t("compare_started_title"), self.t("compare_need_two"))
@@ -3359,7 +4017,7 @@ class MainWindow(QMainWindow):
             raise RuntimeError(self.t("warning_project_text"))
         if source_id == "__current_project__":
             return build_current_project_map(self.snapshot_active_project)
-        item = next((it for it in self.snapshot_items_filtered if it.identifier == source_id), None)
+        item = self._snapshot_items_by_id.get(source_id)
         if item is None:
             raise RuntimeError(f"Unknown source id: {source_id}")
         if item.source == "backup":
@@ -3375,12 +4033,27 @@ class MainWindow(QMainWindow):
         self.snapshot_to_combo.addItem(self.t("compare_current_project"), "__current_project__")
         if self.snapshot_active_project is None:
             return
-        limit = self.resolve_timeline_limit()
-        backups = collect_backup_items(self.snapshot_active_project, limit)
-        commits = collect_git_items(self.snapshot_active_project, self.git_path, limit) if self.git_path else []
-        self.snapshot_items_all = sorted([*backups, *commits], key=lambda x: x.timestamp, reverse=True)[:limit]
+        self.snapshot_items_all = self._collect_timeline_items(self.snapshot_active_project, self.resolve_timeline_limit())
         self.apply_snapshot_filter()
 
+    def _collect_timeline_items(self, project: Path, limit: int) -> list[SnapshotItem]:
+        # Listing backups and running git log is the slow part; reuse it until the inputs change or it is invalidated.
+        key = (project, self.git_path, limit)
+        if key != self._timeline_cache_key:
+            backups = collect_backup_items(project, limit)
+            commits = collect_git_items(project, self.git_path, limit) if self.git_path else []
+            self._timeline_cache = sorted([*backups, *commits], key=lambda x: x.timestamp, reverse=True)[:limit]
+            self._timeline_cache_key = key
+        return list(self._timeline_cache)
+
+    def _invalidate_timeline_cache(self) -> None:
+        self._timeline_cache_key = None
+        self._timeline_cache = []
+
+    def on_snapshot_refresh_clicked(self) -> None:
+        self._invalidate_timeline_cache()
+        self.refresh_snapshot_timeline()
+
     def apply_snapshot_filter(self) -> None:
         mode = "both"
         if self.snapshot_filter_backup.isChecked():
@@ -3393,6 +4066,7 @@ class MainWindow(QMainWindow):
             self.snapshot_items_filtered = [x for x in self.snapshot_items_all if x.source == "git"]
         else:
             self.snapshot_items_filtered = list(self.snapshot_items_all)
+        self._snapshot_items_by_id = {x.identifier: x for x in self.snapshot_items_filtered}
 
         self.snapshot_timeline_list.clear()
         self.snapshot_from_combo.clear()
@@ -3442,6 +4116,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, self.t("compare_backup_title"), str(exc))
             return
         self.snapshot_backup_memo_input.clear()
+        self._invalidate_timeline_cache()
         self.refresh_snapshot_timeline()
 
     def show_compare_page(
@@ -3457,7 +4132,7 @@ class MainWindow(QMainWindow):
         self.compare_to_id = to_id
         self.compare_before_map = before_map or {}
         self.compare_after_map = after_map or {}
-        self.compare_item_list.clear()
+        self._clear_compare_item_list()
         self._reset_compare_preview()
         self.compare_status_label.setText(self.t("compare_loading"))
         self.compare_status_label.setStyleSheet("color: #666666;")
@@ -3468,29 +4143,59 @@ class MainWindow(QMainWindow):
             return
         if self._compare_pending_from_id is None or self._compare_pending_to_id is None:
             return
-        t0 = time.perf_counter()
         from_id = self._compare_pending_from_id
         to_id = self._compare_pending_to_id
+        self._compare_pending_from_id = None
+        self._compare_pending_to_id = None
+        self._compare_map_load_generation += 1
+        # Zip reads and git show run off the GUI thread; the page keeps its loading status meanwhile.
+        task = BackgroundTask(
+            str(self._compare_map_load_generation),
+            lambda: (from_id, to_id, *self._load_source_maps_parallel(self._load_snapshot_source_map, from_id, to_id)),
+        )
+        task.signals.finished.connect(self._on_compare_maps_loaded)
+        task.signals.failed.connect(self._on_compare_maps_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def _load_source_maps_parallel(
+        self,
+        loader: Callable[[str], dict[str, bytes]],
+        from_id: str,
+        to_id: str,
+    ) -> tuple[dict[str, bytes], dict[str, bytes]]:
+        t_load0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="ksnap_maps") as pool:
+            before_future = pool.submit(loader, from_id)
+            after_future = pool.submit(loader, to_id)
+            before_map = before_future.result()
+            after_map = after_future.result()
+        perf_log(
+            "_load_source_maps_parallel "
+            f"before_files={len(before_map)} after_files={len(after_map)} "
+            f"elapsed={time.perf_counter() - t_load0:.3f}s"
+        )
+        return before_map, after_map
+
+    def _compare_map_load_current(self, key: str) -> bool:
+        return key == str(self._compare_map_load_generation) and self.page_stack.currentWidget() is self.compare_page
+
+    def _on_compare_maps_loaded(self, key: str, result: object) -> None:
+        if not self._compare_map_load_current(key):
+            return
+        from_id, to_id, before_map, after_map = result
+        t0 = time.perf_counter()
         try:
-            t_load0 = time.perf_counter()
-            before_map = self._load_snapshot_source_map(from_id)
-            after_map = self._load_snapshot_source_map(to_id)
-            perf_log(
-                "_prepare_compare_after_show/load_maps "
-                f"before_files={len(before_map)} after_files={len(after_map)} "
-                f"elapsed={time.perf_counter() - t_load0:.3f}s"
-            )
             self.compare_from_id = from_id
             self.compare_to_id = to_id
             self.compare_before_map = before_map
             self.compare_after_map = after_map
             t_tmp0 = time.perf_counter()
             self._prepare_compare_temp_dirs()
-            perf_log(f"_prepare_compare_after_show/prepare_tmp elapsed={time.perf_counter() - t_tmp0:.3f}s")
+            perf_log(f"_on_compare_maps_loaded/prepare_tmp elapsed={time.perf_counter() - t_tmp0:.3f}s")
             t_pop0 = time.perf_counter()
             self.populate_compare_item_list()
             perf_log(
-                "_prepare_compare_after_show/populate_items "
+                "_on_compare_maps_loaded/populate_items "
                 f"targets={len(self.compare_targets)} elapsed={time.perf_counter() - t_pop0:.3f}s"
             )
             if self.compare_item_list.count() > 0:
@@ -3500,120 +4205,181 @@ class MainWindow(QMainWindow):
             self.compare_status_label.setText(str(exc))
             self.compare_status_label.setStyleSheet("color: #b00020;")
         finally:
-            perf_log(f"_prepare_compare_after_show/total elapsed={time.perf_counter() - t0:.3f}s")
-            self._compare_pending_from_id = None
-            self._compare_pending_to_id = None
+            perf_log(f"_on_compare_maps_loaded/total elapsed={time.perf_counter() - t0:.3f}s")
+
+    def _on_compare_maps_failed(self, key: str, message: str) -> None:
+        if not self._compare_map_load_current(key):
+            return
+        self.compare_status_label.setText(message)
+        self.compare_status_label.setStyleSheet("color: #b00020;")
 
     def _prepare_compare_temp_dirs(self) -> None:
         self._cleanup_compare_temp_dirs()
         self.compare_render_cache.clear()
         self.compare_targets.clear()
+        self.compare_target_keys.clear()
         if not self.compare_before_map and not self.compare_after_map:
             return
         self._compare_tmp_before_obj = tempfile.TemporaryDirectory(prefix="ksnap_cmp_before_")
         self._compare_tmp_after_obj = tempfile.TemporaryDirectory(prefix="ksnap_cmp_after_")
-        self._compare_tmp_render_obj = tempfile.TemporaryDirectory(prefix="ksnap_cmp_render_")
         self.compare_before_root = Path(self._compare_tmp_before_obj.name)
         self.compare_after_root = Path(self._compare_tmp_after_obj.name)
-        self.compare_render_root = Path(self._compare_tmp_render_obj.name)
-        write_file_map(self.compare_before_root, self.compare_before_map)
-        write_file_map(self.compare_after_root, self.compare_after_map)
+        self.compare_render_root = self._compare_render_session_dir()
+        # Only KiCad design inputs are needed to render; 3D models, outputs, etc. are written on demand.
+        self._compare_deferred_files = {
+            self.compare_before_root: write_file_map_filtered(
+                self.compare_before_root, self.compare_before_map, is_compare_render_input
+            ),
+            self.compare_after_root: write_file_map_filtered(
+                self.compare_after_root, self.compare_after_map, is_compare_render_input
+            ),
+        }
+
+    def _compare_render_session_dir(self) -> Path:
+        if self._compare_render_cache_obj is None:
+            self._compare_render_cache_obj = tempfile.TemporaryDirectory(
+                prefix="ksnap_cmp_render_", ignore_cleanup_errors=True
+            )
+        cache_root = Path(self._compare_render_cache_obj.name)
+        digest = hashlib.sha1()
+        # A different kicad-cli can render the same files differently, so it gets its own session.
+        if self.cli_candidate is not None:
+            digest.update(f"{self.cli_candidate.path}\0{self.cli_candidate.version_text}\1".encode("utf-8"))
+        for file_map in (self.compare_before_map, self.compare_after_map):
+            for rel_path in sorted(file_map):
+                digest.update(rel_path.encode("utf-8") + b"\0")
+                digest.update(hashlib.sha1(file_map[rel_path]).digest())
+            digest.update(b"\1")
+        session_dir = cache_root / digest.hexdigest()[:16]
+        session_dir.mkdir(parents=True, exist_ok=True)
+        os.utime(session_dir)
+        sessions = [p for p in cache_root.iterdir() if p.is_dir() and p != session_dir]
+        sessions.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        for stale in sessions[COMPARE_RENDER_SESSIONS_KEPT - 1 :]:
+            shutil.rmtree(stale, ignore_errors=True)
+        return session_dir
 
     def _cleanup_compare_temp_dirs(self) -> None:
         if hasattr(self, "compare_auto_cycle_timer"):
             self.compare_auto_cycle_timer.stop()
         if hasattr(self, "compare_status_refresh_timer"):
             self.compare_status_refresh_timer.stop()
-        self.compare_precache_active = False
         self._compare_precache_stop.set()
-        # Wait until background render worker exits to avoid temp-dir races on reopen.
-        if self._compare_precache_thread is not None and self._compare_precache_thread.is_alive():
-            self._compare_precache_thread.join()
-        self._compare_precache_thread = None
-        for obj in [self._compare_tmp_before_obj, self._compare_tmp_after_obj, self._compare_tmp_render_obj]:
+        # Wait until background render workers exit to avoid temp-dir races on reopen.
+        for executor in self._compare_precache_executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._compare_precache_executors.clear()
+        self._compare_precache_futures = []
+        self._compare_target_locks.clear()
+        self._compare_render_pool.clear()
+        self._compare_render_pool.waitForDone()
+        self._compare_png_pool.waitForDone()
+        with self._compare_render_lock:
+            self._compare_qimage_cache.clear()
+        self._compare_layer_svgs.clear()
+        # Results still queued for delivery belong to the old session; drop them.
+        self._compare_render_inflight.clear()
+        self._compare_deferred_files = {}
+        self._compare_deferred_written.clear()
+        for obj in [self._compare_tmp_before_obj, self._compare_tmp_after_obj]:
             if obj is not None:
                 obj.cleanup()
         self._compare_tmp_before_obj = None
         self._compare_tmp_after_obj = None
-        self._compare_tmp_render_obj = None
         self.compare_before_root = None
         self.compare_after_root = None
         self.compare_render_root = None
 
     def populate_compare_item_list(self) -> None:
-        self.compare_item_list.clear()
         self.compare_targets.clear()
-        self.compare_target_labels.clear()
-        with self._compare_status_lock:
-            self.compare_target_status.clear()
+        self.compare_target_keys.clear()
+        self._clear_compare_item_list()
         self._reset_compare_preview()
         if self.compare_active_project is None:
             return
         if self.compare_before_root is None or self.compare_after_root is None:
             return
 
-        sch_paths = sorted(
-            {p.relative_to(self.compare_before_root).as_posix() for p in self.compare_before_root.rglob("*.kicad_sch")}
-            | {p.relative_to(self.compare_after_root).as_posix() for p in self.compare_after_root.rglob("*.kicad_sch")}
-        )
-        for rel_path in sch_paths:
-            target = {"kind": "sch", "path": rel_path, "layer": None}
-            self.compare_targets.append(target)
-            label = f"SCH / {rel_path}"
-            self.compare_target_labels.append(label)
-            with self._compare_status_lock:
-                self.compare_target_status[self._compare_target_key(target)] = "pending"
-
-        pcb_paths = sorted(
-            {p.relative_to(self.compare_before_root).as_posix() for p in self.compare_before_root.rglob("*.kicad_pcb")}
-            | {p.relative_to(self.compare_after_root).as_posix() for p in self.compare_after_root.rglob("*.kicad_pcb")}
-        )
-        for rel_path in pcb_paths:
-            target = {"kind": "pcb", "path": rel_path, "layer": None}
-            self.compare_targets.append(target)
-            label = f"PCB / {rel_path} / board"
-            self.compare_target_labels.append(label)
-            with self._compare_status_lock:
-                self.compare_target_status[self._compare_target_key(target)] = "pending"
+        sch_paths, pcb_paths = _collect_kicad_files(self.compare_before_root)
+        after_sch, after_pcb = _collect_kicad_files(self.compare_after_root)
+        sch_paths |= after_sch
+        pcb_paths |= after_pcb
+        self._compare_identical_paths = self._find_compare_identical_paths(sch_paths | pcb_paths)
+        labels: list[str] = []
+        statuses: list[str] = []
+        for rel_path in sorted(sch_paths):
+            self.compare_targets.append({"kind": "sch", "path": rel_path, "layer": None})
+            labels.append(f"SCH / {rel_path}")
+            statuses.append(self._initial_compare_status(rel_path))
+
+        for rel_path in sorted(pcb_paths):
+            self.compare_targets.append({"kind": "pcb", "path": rel_path, "layer": None})
+            labels.append(f"PCB / {rel_path} / board")
+            statuses.append(self._initial_compare_status(rel_path))
 
             layers: list[str] = []
-            before_pcb = self.compare_before_root / rel_path
-            after_pcb = self.compare_after_root / rel_path
-            if before_pcb.exists() and self.cli_candidate is not None:
-                layers.extend(detect_pcb_layers(self.cli_candidate.path, before_pcb))
-            elif before_pcb.exists():
-                layers.extend(parse_pcb_layers_from_file(before_pcb))
-            if after_pcb.exists() and self.cli_candidate is not None:
-                layers.extend(detect_pcb_layers(self.cli_candidate.path, after_pcb))
-            elif after_pcb.exists():
-                layers.extend(parse_pcb_layers_from_file(after_pcb))
+            for root, file_map in (
+                (self.compare_before_root, self.compare_before_map),
+                (self.compare_after_root, self.compare_after_map),
+            ):
+                pcb_path = root / rel_path
+                if pcb_path.exists():
+                    layers.extend(self._detect_compare_pcb_layers(pcb_path, file_map.get(rel_path)))
             for layer in list(dict.fromkeys(layers)):
-                target = {"kind": "pcb", "path": rel_path, "layer": layer}
-                self.compare_targets.append(target)
-                label = f"PCB / {rel_path} / {layer}"
-                self.compare_target_labels.append(label)
-                with self._compare_status_lock:
-                    self.compare_target_status[self._compare_target_key(target)] = "pending"
+                self.compare_targets.append({"kind": "pcb", "path": rel_path, "layer": layer})
+                labels.append(f"PCB / {rel_path} / {layer}")
+                statuses.append(self._initial_compare_status(rel_path))
 
-        self._refresh_compare_item_list_labels()
+        self.compare_target_keys = [self._compare_target_key(target) for target in self.compare_targets]
+        self.compare_target_model.reset(labels, self.compare_target_keys, statuses, lock=self._compare_status_lock)
 
         if self.compare_item_list.count() == 0:
             self.compare_status_label.setText(self.t("compare_image_no_targets"))
             self.compare_status_label.setStyleSheet("color: #9a6700;")
-            if self.compare_status_refresh_timer.isActive():
-                self.compare_status_refresh_timer.stop()
         else:
             self.compare_status_label.setText(self.t("compare_image_status_ready"))
             self.compare_status_label.setStyleSheet("color: #2b7a0b;")
-            if not self.compare_status_refresh_timer.isActive():
-                self.compare_status_refresh_timer.start()
+
+    def _find_compare_identical_paths(self, rel_paths: set[str]) -> set[str]:
+        # Every other render input (project, libraries, worksheets, ...) affects all renders, so it must match too.
+        for rel_path in self.compare_before_map.keys() | self.compare_after_map.keys():
+            if is_compare_render_input(rel_path) and not rel_path.endswith((".kicad_sch", ".kicad_pcb")):
+                if self.compare_before_map.get(rel_path) != self.compare_after_map.get(rel_path):
+                    return set()
+        identical: set[str] = set()
+        for rel_path in rel_paths:
+            before_data = self.compare_before_map.get(rel_path)
+            if before_data and before_data == self.compare_after_map.get(rel_path):
+                identical.add(rel_path)
+        return identical
+
+    def _initial_compare_status(self, rel_path: str) -> str:
+        return "same" if rel_path in self._compare_identical_paths else "pending"
+
+    def _detect_compare_pcb_layers(self, pcb_path: Path, data: bytes | None) -> list[str]:
+        if data is None:
+            try:
+                data = pcb_path.read_bytes()
+            except OSError:
+                data = b""
+        cli_path = str(self.cli_candidate.path) if self.cli_candidate is not None else ""
+        # Keyed by content so identical boards on both sides or across compares skip kicad-cli.
+        cache_key = (cli_path, hashlib.sha1(data).hexdigest())
+        layers = self._pcb_layers_cache.get(cache_key)
+        if layers is None:
+            if self.cli_candidate is not None:
+                layers = detect_pcb_layers(self.cli_candidate.path, pcb_path)
+            else:
+                layers = parse_pcb_layers_from_file(pcb_path)
+            self._pcb_layers_cache[cache_key] = layers
+        return list(layers)
 
     def on_compare_item_selected(self, row: int) -> None:
         if row < 0 or row >= len(self.compare_targets):
             self._reset_compare_preview()
             return
         target = self.compare_targets[row]
-        key = self._compare_target_key(target)
+        key = self.compare_target_keys[row]
         render_cache_key = self._compare_render_cache_key(target)
         cached = self.compare_render_cache.get(render_cache_key)
         if cached is not None:
@@ -3622,39 +4388,149 @@ class MainWindow(QMainWindow):
             self.compare_status_label.setStyleSheet("color: #2b7a0b;")
             return
 
-        with self._compare_status_lock:
-            self.compare_target_status[key] = "rendering"
+        self._set_compare_status(key, "rendering", only_from=("pending", "rendering", "error"))
         self._refresh_compare_item_list_labels()
         self.compare_status_label.setText(self.t("compare_image_rendering"))
         self.compare_status_label.setStyleSheet("color: #666666;")
         self._set_compare_rendering_text()
-        QApplication.processEvents()
-        try:
-            before_img, after_img, diff_img = self._render_compare_target(target)
-        except Exception as exc:
-            with self._compare_status_lock:
-                self.compare_target_status[key] = "error"
-            self.compare_status_label.setText(str(exc))
-            self.compare_status_label.setStyleSheet("color: #b00020;")
-            self._reset_compare_preview()
-            self._refresh_compare_item_list_labels()
+        if render_cache_key in self._compare_render_inflight:
+            return
+        # New selections always open in fit mode, so a PNG fallback only needs the viewport size.
+        viewport = self.compare_image_scrolls[self._current_compare_image_key()].viewport().size()
+        fit_size = viewport if viewport.width() > 16 and viewport.height() > 16 else None
+        # Render off the GUI thread; the result is applied only if this row is still selected.
+        self._compare_render_inflight[render_cache_key] = key
+        task = BackgroundTask(
+            render_cache_key,
+            lambda target=target, fit_size=fit_size: self._render_compare_target(target, fit_size),
+        )
+        task.signals.finished.connect(self._on_compare_render_finished)
+        task.signals.failed.connect(self._on_compare_render_failed)
+        self._compare_render_pool.start(task)
+
+    def _current_compare_render_cache_key(self) -> str | None:
+        row = self.compare_item_list.currentRow()
+        if row < 0 or row >= len(self.compare_targets):
+            return None
+        return self._compare_render_cache_key(self.compare_targets[row])
+
+    def _on_compare_render_finished(self, render_cache_key: str, images: object) -> None:
+        if self._compare_render_inflight.pop(render_cache_key, None) is None:
+            return
+        before_img, after_img, diff_img, reduced = images  # type: ignore[misc]
+        if not reduced:
+            self.compare_render_cache[render_cache_key] = (before_img, after_img, diff_img)
+        self._refresh_compare_item_list_labels()
+        if render_cache_key != self._current_compare_render_cache_key():
             return
-        self.compare_render_cache[render_cache_key] = (before_img, after_img, diff_img)
         self._set_compare_images(before_img, after_img, diff_img)
+        self._compare_preview_reduced = reduced
         self.compare_status_label.setText(self.t("compare_image_status_ready"))
         self.compare_status_label.setStyleSheet("color: #2b7a0b;")
 
+    def _on_compare_render_failed(self, render_cache_key: str, message: str) -> None:
+        key = self._compare_render_inflight.pop(render_cache_key, None)
+        if key is None:
+            return
+        self._set_compare_status(key, "error")
+        self._refresh_compare_item_list_labels()
+        if render_cache_key != self._current_compare_render_cache_key():
+            return
+        self.compare_status_label.setText(message)
+        self.compare_status_label.setStyleSheet("color: #b00020;")
+        self._reset_compare_preview()
+
     def _compare_target_key(self, target: dict[str, str | None]) -> str:
         return f"{target.get('kind') or ''}|{target.get('path') or ''}|{target.get('layer') or ''}"
 
-    def _render_compare_target(self, target: dict[str, str | None]) -> tuple[QImage, QImage, QImage]:
-        before_png, after_png, diff_png = self._ensure_compare_target_cache(target)
-        before_img = QImage(str(before_png))
-        after_img = QImage(str(after_png))
-        diff_img = QImage(str(diff_png))
+    def _render_compare_target(
+        self,
+        target: dict[str, str | None],
+        fit_size: QSize | None = None,
+    ) -> tuple[QImage, QImage, QImage, bool]:
+        if fit_size is not None:
+            reduced = self._load_compare_pngs_scaled(target, fit_size)
+            if reduced is not None:
+                return (*reduced, True)
+        before_img, after_img, diff_img = self._ensure_compare_target_cache(target)
         if before_img.isNull() or after_img.isNull() or diff_img.isNull():
             raise RuntimeError(self.t("compare_image_not_available"))
-        return before_img, after_img, diff_img
+        return before_img, after_img, diff_img, False
+
+    def _load_compare_pngs_scaled(
+        self,
+        target: dict[str, str | None],
+        fit_size: QSize,
+    ) -> tuple[QImage, QImage, QImage] | None:
+        with self._compare_render_lock:
+            if self._compare_render_cache_key(target) in self._compare_qimage_cache:
+                return None
+        # Scaled images cannot classify the row reliably, so the fast path needs the saved status.
+        status = self._read_compare_cached_status(target)
+        if status is None:
+            return None
+        paths = self._cache_paths_for_target(target)
+        images: list[QImage] = []
+        for path in paths:
+            reader = QImageReader(str(path))
+            native = reader.size()
+            if native.isValid() and (native.width() > fit_size.width() or native.height() > fit_size.height()):
+                reader.setScaledSize(native.scaled(fit_size, Qt.KeepAspectRatio))
+            image = reader.read()
+            if image.isNull():
+                return None
+            images.append(image)
+        self._set_compare_status(self._compare_target_key(target), status)
+        return images[0], images[1], images[2]
+
+    def _ensure_compare_full_resolution(self) -> None:
+        if not self._compare_preview_reduced:
+            return
+        self._compare_preview_reduced = False
+        row = self.compare_item_list.currentRow()
+        if row < 0 or row >= len(self.compare_targets):
+            return
+        target = self.compare_targets[row]
+        render_cache_key = self._compare_render_cache_key(target)
+        if render_cache_key in self._compare_render_inflight:
+            return
+        # Zooming keeps showing the reduced preview until the full-size images arrive.
+        self._compare_render_inflight[render_cache_key] = self.compare_target_keys[row]
+        task = BackgroundTask(render_cache_key, lambda target=target: self._render_compare_target(target))
+        task.signals.finished.connect(self._on_compare_full_resolution_finished)
+        task.signals.failed.connect(self._on_compare_full_resolution_failed)
+        self._compare_render_pool.start(task)
+
+    def _on_compare_full_resolution_finished(self, render_cache_key: str, images: object) -> None:
+        if self._compare_render_inflight.pop(render_cache_key, None) is None:
+            return
+        before_img, after_img, diff_img, _ = images  # type: ignore[misc]
+        self.compare_render_cache[render_cache_key] = (before_img, after_img, diff_img)
+        if render_cache_key != self._current_compare_render_cache_key():
+            return
+        self.compare_status_label.setText(self.t("compare_image_status_ready"))
+        self.compare_status_label.setStyleSheet("color: #2b7a0b;")
+        previous = self.compare_diff_image_raw
+        if previous is None:
+            # The row was reselected meanwhile and is waiting on this render.
+            self._set_compare_images(before_img, after_img, diff_img)
+            return
+        if self.compare_zoom_mode == "manual" and previous.width() > 0 and diff_img.width() > 0:
+            # Keep the on-screen size unchanged when the larger images replace the preview.
+            self.compare_zoom_scale *= previous.width() / diff_img.width()
+        self._compare_raw_pixmaps.clear()
+        self.compare_before_image_raw = before_img
+        self.compare_after_image_raw = after_img
+        self.compare_diff_image_raw = diff_img
+        self._render_compare_image_labels()
+
+    def _on_compare_full_resolution_failed(self, render_cache_key: str, message: str) -> None:
+        if self._compare_render_inflight.pop(render_cache_key, None) is None:
+            return
+        if render_cache_key != self._current_compare_render_cache_key():
+            return
+        self.compare_status_label.setText(message)
+        self.compare_status_label.setStyleSheet("color: #b00020;")
 
     def _compare_render_cache_key(self, target: dict[str, str | None]) -> str:
         return f"{self._compare_target_key(target)}|scale={self.compare_render_scale:g}"
@@ -3671,7 +4547,7 @@ class MainWindow(QMainWindow):
             cache_dir / f"{cache_key}_diff.png",
         )
 
-    def _ensure_compare_target_cache(self, target: dict[str, str | None]) -> tuple[Path, Path, Path]:
+    def _ensure_compare_target_cache(self, target: dict[str, str | None]) -> tuple[QImage, QImage, QImage]:
         total_t0 = time.perf_counter()
         if self.compare_before_root is None or self.compare_after_root is None or self.compare_render_root is None:
             raise RuntimeError(self.t("compare_image_not_available"))
@@ -3687,52 +4563,42 @@ class MainWindow(QMainWindow):
         before_png, after_png, diff_png = self._cache_paths_for_target(target)
         target_key = self._compare_target_key(target)
         target_desc = f"{kind}|{rel_path}|{layer or 'board'}"
-        if before_png.exists() and after_png.exists() and diff_png.exists():
-            try:
-                b = QImage(str(before_png))
-                a = QImage(str(after_png))
-                status = "diff" if (not b.isNull() and not a.isNull() and images_different(b, a)) else "same"
-            except Exception:
-                status = "error"
-            with self._compare_status_lock:
-                self.compare_target_status[target_key] = status
+        cached = self._load_compare_cached_images(target, before_png, after_png, diff_png)
+        if cached is not None:
             perf_log(
                 "_ensure_compare_target_cache/cache_hit "
-                f"target={target_desc} status={status} elapsed={time.perf_counter() - total_t0:.3f}s"
+                f"target={target_desc} elapsed={time.perf_counter() - total_t0:.3f}s"
             )
-            return before_png, after_png, diff_png
+            return cached
 
-        with self._compare_render_lock:
-            if before_png.exists() and after_png.exists() and diff_png.exists():
-                try:
-                    b = QImage(str(before_png))
-                    a = QImage(str(after_png))
-                    status = "diff" if (not b.isNull() and not a.isNull() and images_different(b, a)) else "same"
-                except Exception:
-                    status = "error"
-                with self._compare_status_lock:
-                    self.compare_target_status[target_key] = status
+        with self._compare_target_lock(target_key):
+            cached = self._load_compare_cached_images(target, before_png, after_png, diff_png)
+            if cached is not None:
                 perf_log(
                     "_ensure_compare_target_cache/cache_hit_after_lock "
-                    f"target={target_desc} status={status} elapsed={time.perf_counter() - total_t0:.3f}s"
+                    f"target={target_desc} elapsed={time.perf_counter() - total_t0:.3f}s"
                 )
-                return before_png, after_png, diff_png
+                return cached
 
             before_src = self.compare_before_root / rel_path
             after_src = self.compare_after_root / rel_path
-            key = re.sub(r"[^A-Za-z0-9._-]+", "_", self._compare_target_key(target))
+            key = _SAFE_KEY_RE.sub("_", target_key)
             t_export0 = time.perf_counter()
             before_svg = self._export_compare_svg(
                 before_src if before_src.exists() else None,
                 kind,
                 layer,
                 self.compare_render_root / "before" / key,
+                rel_path,
             )
-            after_svg = self._export_compare_svg(
+            # Unchanged inputs render the same on both sides, so export and rasterize only once.
+            identical = rel_path in self._compare_identical_paths
+            after_svg = None if identical else self._export_compare_svg(
                 after_src if after_src.exists() else None,
                 kind,
                 layer,
                 self.compare_render_root / "after" / key,
+                rel_path,
             )
             t_export = time.perf_counter() - t_export0
 
@@ -3740,52 +4606,190 @@ class MainWindow(QMainWindow):
                 raise RuntimeError(self.t("compare_image_not_available"))
             t_raster0 = time.perf_counter()
             before_img = render_svg_to_image(before_svg, self.compare_render_scale) if before_svg is not None else None
-            after_img = render_svg_to_image(after_svg, self.compare_render_scale) if after_svg is not None else None
+            if identical:
+                after_img = before_img
+            else:
+                after_img = render_svg_to_image(after_svg, self.compare_render_scale) if after_svg is not None else None
             t_raster = time.perf_counter() - t_raster0
             if before_img is None and after_img is None:
                 raise RuntimeError(self.t("compare_image_not_available"))
             if before_img is None:
-                before_img = QImage(after_img.width(), after_img.height(), QImage.Format_ARGB32)  # type: ignore[union-attr]
+                before_img = QImage(after_img.width(), after_img.height(), DIFF_IMAGE_FORMAT)  # type: ignore[union-attr]
                 before_img.fill(Qt.white)
             if after_img is None:
-                after_img = QImage(before_img.width(), before_img.height(), QImage.Format_ARGB32)  # type: ignore[union-attr]
+                after_img = QImage(before_img.width(), before_img.height(), DIFF_IMAGE_FORMAT)  # type: ignore[union-attr]
                 after_img.fill(Qt.white)
             t_diff0 = time.perf_counter()
-            before_img, after_img = normalize_image_sizes(before_img, after_img)
-            has_diff = images_different(before_img, after_img)
-            diff_img = make_pixel_diff_image(before_img, after_img)
+            if identical:
+                has_diff, diff_img = False, before_img
+            else:
+                before_img, after_img = normalize_image_sizes(before_img, after_img)
+                has_diff, diff_img = compare_pixel_images(before_img, after_img)
             t_diff = time.perf_counter() - t_diff0
-            t_save0 = time.perf_counter()
-            before_img.save(str(before_png), "PNG")
-            after_img.save(str(after_png), "PNG")
-            diff_img.save(str(diff_png), "PNG")
-            t_save = time.perf_counter() - t_save0
-            with self._compare_status_lock:
-                self.compare_target_status[target_key] = "diff" if has_diff else "same"
+            images = (before_img, after_img, diff_img)
+            self._store_compare_qimages(self._compare_render_cache_key(target), images)
+            self._compare_png_pool.start(
+                lambda: self._save_compare_pngs(
+                    images, (before_png, after_png, diff_png), "diff" if has_diff else "same"
+                )
+            )
+            self._set_compare_status(target_key, "diff" if has_diff else "same")
             perf_log(
                 "_ensure_compare_target_cache/render "
                 f"target={target_desc} export={t_export:.3f}s raster={t_raster:.3f}s "
-                f"diff={t_diff:.3f}s save={t_save:.3f}s total={time.perf_counter() - total_t0:.3f}s "
+                f"diff={t_diff:.3f}s total={time.perf_counter() - total_t0:.3f}s "
                 f"size={before_img.width()}x{before_img.height()} scale={self.compare_render_scale:g} diff={has_diff}"
             )
-        return before_png, after_png, diff_png
+        return images
 
-    def _export_compare_svg(self, source: Path | None, kind: str, layer: str | None, out_dir: Path) -> Path | None:
+    def _store_compare_qimages(self, render_cache_key: str, images: tuple[QImage, QImage, QImage]) -> None:
+        with self._compare_render_lock:
+            self._compare_qimage_cache[render_cache_key] = images
+            self._compare_qimage_cache.move_to_end(render_cache_key)
+            while len(self._compare_qimage_cache) > COMPARE_QIMAGE_CACHE_SIZE:
+                self._compare_qimage_cache.popitem(last=False)
+
+    def _load_compare_cached_images(
+        self,
+        target: dict[str, str | None],
+        before_png: Path,
+        after_png: Path,
+        diff_png: Path,
+    ) -> tuple[QImage, QImage, QImage] | None:
+        render_cache_key = self._compare_render_cache_key(target)
+        with self._compare_render_lock:
+            images = self._compare_qimage_cache.get(render_cache_key)
+            if images is not None:
+                self._compare_qimage_cache.move_to_end(render_cache_key)
+        if images is None:
+            if not (before_png.exists() and after_png.exists() and diff_png.exists()):
+                return None
+            images = (QImage(str(before_png)), QImage(str(after_png)), QImage(str(diff_png)))
+            if any(img.isNull() for img in images):
+                return None
+            self._store_compare_qimages(render_cache_key, images)
+        target_key = self._compare_target_key(target)
+        known = self.compare_target_model.status(target_key)
+        if known not in {"diff", "same"}:
+            status = self._read_compare_status_file(diff_png)
+            if status is None:
+                status = "diff" if images_different(images[0], images[1]) else "same"
+                with contextlib.suppress(OSError):
+                    self._compare_status_path(diff_png).write_text(status, encoding="utf-8")
+            self._set_compare_status(target_key, status)
+        return images
+
+    def _compare_status_path(self, diff_png: Path) -> Path:
+        return diff_png.with_name(diff_png.name.replace("_diff.png", ".status"))
+
+    def _read_compare_status_file(self, diff_png: Path) -> str | None:
+        try:
+            status = self._compare_status_path(diff_png).read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        return status if status in {"diff", "same"} else None
+
+    def _read_compare_cached_status(self, target: dict[str, str | None]) -> str | None:
+        # Precache only needs the classification; decoding the PNGs waits until the row is shown.
+        before_png, after_png, diff_png = self._cache_paths_for_target(target)
+        if not (before_png.exists() and after_png.exists() and diff_png.exists()):
+            return None
+        return self._read_compare_status_file(diff_png)
+
+    def _save_compare_pngs(
+        self,
+        images: tuple[QImage, QImage, QImage],
+        paths: tuple[Path, Path, Path],
+        status: str,
+    ) -> None:
+        # Write under a temporary name so readers never see a partially written PNG.
+        saved: list[tuple[QImage, Path]] = []
+        with contextlib.suppress(OSError):
+            for image, path in zip(images, paths):
+                tmp_path = path.with_name(f"{path.stem}.tmp.png")
+                same = next((done for img, done in saved if img is image), None)
+                if same is not None:
+                    shutil.copyfile(same, tmp_path)
+                elif not image.save(str(tmp_path), "PNG"):
+                    return
+                os.replace(tmp_path, path)
+                saved.append((image, path))
+            # Written last, so a sidecar always refers to a complete PNG set.
+            self._compare_status_path(paths[2]).write_text(status, encoding="utf-8")
+
+    def _export_compare_svg(
+        self,
+        source: Path | None,
+        kind: str,
+        layer: str | None,
+        out_dir: Path,
+        rel_path: str | None = None,
+    ) -> Path | None:
         if source is None:
             return None
-        out_dir.mkdir(parents=True, exist_ok=True)
-        if kind == "sch":
-            svgs = export_svg_bundle_with_kicad_cli(self.cli_candidate.path, source, out_dir, "sch")  # type: ignore[union-attr]
-        elif kind == "pcb":
-            svgs = export_svg_bundle_with_kicad_cli(self.cli_candidate.path, source, out_dir, "pcb", pcb_layers=layer)  # type: ignore[union-attr]
-        else:
+        if kind == "pcb" and layer and rel_path is not None:
+            batched = self._export_compare_layer_svg(source, layer, rel_path)
+            if batched is not None:
+                return batched
+        if kind not in {"sch", "pcb"}:
             return None
+        out_dir.mkdir(parents=True, exist_ok=True)
+        pcb_layers = layer if kind == "pcb" else None
+        try:
+            svgs = export_svg_bundle_with_kicad_cli(self.cli_candidate.path, source, out_dir, kind, pcb_layers=pcb_layers)  # type: ignore[union-attr]
+        except RuntimeError:
+            # The design may reference a file that was deferred; materialize everything and retry once.
+            if not self._write_deferred_compare_files():
+                raise
+            svgs = export_svg_bundle_with_kicad_cli(self.cli_candidate.path, source, out_dir, kind, pcb_layers=pcb_layers)  # type: ignore[union-attr]
         return svgs[0] if svgs else None
 
+    def _write_deferred_compare_files(self) -> bool:
+        # True when deferred files exist on disk now, so every failed export retries, not only the writer's.
+        with self._compare_target_lock("deferred-files"):
+            deferred = self._compare_deferred_files
+            self._compare_deferred_files = {}
+            for root, file_map in deferred.items():
+                if file_map:
+                    write_file_map(root, file_map)
+                    self._compare_deferred_written.set()
+        return self._compare_deferred_written.is_set()
+
+    def _export_compare_layer_svg(self, source: Path, layer: str, rel_path: str) -> Path | None:
+        # Export every listed layer of a board in one kicad-cli run; boards are keyed by content
+        # so identical before/after files share the output. Missing layers fall back per layer.
+        if self.compare_render_root is None or self.cli_candidate is None:
+            return None
+        try:
+            digest = hashlib.sha1(source.read_bytes()).hexdigest()
+        except OSError:
+            return None
+        with self._compare_target_lock(f"layers|{digest}"):
+            svgs = self._compare_layer_svgs.get(digest)
+            if svgs is None:
+                layers = [
+                    str(t["layer"])
+                    for t in self.compare_targets
+                    if t.get("kind") == "pcb" and t.get("path") == rel_path and t.get("layer")
+                ]
+                try:
+                    svgs = export_pcb_layer_svgs_with_kicad_cli(
+                        self.cli_candidate.path,
+                        source,
+                        self.compare_render_root / "layers" / digest,
+                        layers or [layer],
+                    )
+                except Exception:
+                    svgs = {}
+                self._compare_layer_svgs[digest] = svgs
+        return svgs.get(layer)
+
     def _set_compare_images(self, before_img: QImage, after_img: QImage, diff_img: QImage) -> None:
+        self._compare_raw_pixmaps.clear()
         self.compare_before_image_raw = before_img
         self.compare_after_image_raw = after_img
         self.compare_diff_image_raw = diff_img
+        self._compare_preview_reduced = False
         self.compare_auto_cycle_index = 0
         self.compare_zoom_mode = "fit"
         self.compare_zoom_scale = 1.0
@@ -3795,6 +4799,8 @@ class MainWindow(QMainWindow):
             self.compare_auto_cycle_timer.start()
 
     def _reset_compare_preview(self) -> None:
+        self._compare_raw_pixmaps.clear()
+        self._compare_preview_reduced = False
         self.compare_before_image_raw = None
         self.compare_after_image_raw = None
         self.compare_diff_image_raw = None
@@ -3808,6 +4814,7 @@ class MainWindow(QMainWindow):
         self.compare_after_image_raw = None
         self.compare_diff_image_raw = None
         self.compare_auto_cycle_index = 0
+        self._compare_raw_pixmaps.clear()
         for label in [self.compare_diff_image_label, self.compare_before_image_label, self.compare_after_image_label, self.compare_auto_image_label]:
             label.clear()
             label.setText(self.t("compare_image_rendering"))
@@ -3826,56 +4833,93 @@ class MainWindow(QMainWindow):
             suffix = " [!]"
         return f"{base_label}{suffix}"
 
+    def _clear_compare_item_list(self) -> None:
+        self.compare_target_model.reset([], [], [], lock=self._compare_status_lock)
+        self._compare_list_dirty = False
+        self._drain_compare_changed_rows()
+
+    def _set_compare_status(self, key: str, status: str, only_from: Iterable[str] | None = None) -> None:
+        # Only the conditional row write is locked; the row is repainted on the next label refresh.
+        with self._compare_status_lock:
+            row = self.compare_target_model.set_status(key, status, only_from)
+        if row >= 0:
+            self._compare_changed_rows.put(row)
+            if not self._compare_list_dirty:
+                self._compare_list_dirty = True
+                self.compare_status_changed.emit()
+
+    def _drain_compare_changed_rows(self) -> set[int]:
+        rows: set[int] = set()
+        with contextlib.suppress(queue.Empty):
+            while True:
+                rows.add(self._compare_changed_rows.get_nowait())
+        return rows
+
+    def _schedule_compare_list_refresh(self) -> None:
+        if not self.compare_status_refresh_timer.isActive():
+            self.compare_status_refresh_timer.start()
+
     def _refresh_compare_item_list_labels(self) -> None:
-        if not hasattr(self, "compare_item_list"):
+        if not hasattr(self, "compare_target_model"):
             return
-        current = self.compare_item_list.currentRow()
-        self.compare_item_list.blockSignals(True)
-        self.compare_item_list.clear()
-        with self._compare_status_lock:
-            for i, base in enumerate(self.compare_target_labels):
-                status = "pending"
-                if i < len(self.compare_targets):
-                    key = self._compare_target_key(self.compare_targets[i])
-                    status = self.compare_target_status.get(key, "pending")
-                self.compare_item_list.addItem(self._format_compare_list_label(base, status))
-        if 0 <= current < self.compare_item_list.count():
-            self.compare_item_list.setCurrentRow(current)
-        self.compare_item_list.blockSignals(False)
+        # Clear the flag before draining so a write racing the drain schedules another refresh.
+        self._compare_list_dirty = False
+        self.compare_target_model.notify_rows(sorted(self._drain_compare_changed_rows()))
+
+    def _compare_target_lock(self, target_key: str) -> threading.Lock:
+        # Per-target locks let precache workers render different targets in parallel
+        # while concurrent requests for the same target still coalesce.
+        with self._compare_render_lock:
+            lock = self._compare_target_locks.get(target_key)
+            if lock is None:
+                lock = threading.Lock()
+                self._compare_target_locks[target_key] = lock
+            return lock
+
+    def _compare_precache_running(self) -> bool:
+        return any(not future.done() for future in self._compare_precache_futures)
 
     def _start_compare_precache(self) -> None:
-        if self.compare_precache_active:
+        if self._compare_precache_running():
+            return
+        targets = list(zip(self.compare_targets, self.compare_target_keys))
+        if not targets:
             return
         self._compare_precache_stop.clear()
-        self.compare_precache_active = True
-        targets = list(self.compare_targets)
-        self._compare_precache_thread = threading.Thread(
-            target=self._run_compare_precache_worker,
-            args=(targets,),
-            daemon=True,
-        )
-        self._compare_precache_thread.start()
+        self._compare_precache_generation += 1
+        generation = self._compare_precache_generation
+        # kicad-cli runs out of process, so a few workers overlap exports without GIL contention.
+        workers = min(precache_worker_limit(), len(targets))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ksnap_precache")
+        self._compare_precache_futures = [
+            executor.submit(self._run_compare_precache_target, target, key, generation) for target, key in targets
+        ]
+        self._compare_precache_executors[executor] = self._compare_precache_futures
+
+    def _restart_compare_precache(self) -> None:
+        for executor in self._compare_precache_executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+        # Workers still running write into the session temp dirs, so cleanup must keep waiting on them.
+        self._compare_precache_executors = {
+            executor: futures
+            for executor, futures in self._compare_precache_executors.items()
+            if not all(future.done() for future in futures)
+        }
+        self._compare_precache_futures = []
+        self._start_compare_precache()
 
-    def _run_compare_precache_worker(self, targets: list[dict[str, str | None]]) -> None:
+    def _run_compare_precache_target(self, target: dict[str, str | None], key: str, generation: int) -> None:
+        if self._compare_precache_stop.is_set() or generation != self._compare_precache_generation:
+            return
+        self._set_compare_status(key, "rendering", only_from=("pending",))
         try:
-            for target in targets:
-                if self._compare_precache_stop.is_set():
-                    break
-                key = self._compare_target_key(target)
-                with self._compare_status_lock:
-                    current = self.compare_target_status.get(key, "pending")
-                    if current == "pending":
-                        self.compare_target_status[key] = "rendering"
-                try:
-                    self._ensure_compare_target_cache(target)
-                except Exception:
-                    with self._compare_status_lock:
-                        self.compare_target_status[key] = "error"
-                    continue
-                if self._compare_precache_stop.is_set():
-                    break
-        finally:
-            self.compare_precache_active = False
+            status = self._read_compare_cached_status(target)
+            if status is not None:
+                self._set_compare_status(key, status)
+                return
+            self._ensure_compare_target_cache(target)
+        except Exception:
+            self._set_compare_status(key, "error")
 
     def _connect_compare_image_scroll_sync(self) -> None:
         for scroll in self.compare_image_scrolls.values():
@@ -3888,21 +4932,30 @@ class MainWindow(QMainWindow):
         source_bar = self.sender()
         if source_bar is None:
             return
-        source_max = source_bar.maximum()
-        ratio = 0.0 if source_max <= 0 else source_bar.value() / source_max
-        source_is_vertical = source_bar.orientation() == Qt.Vertical
-        if source_is_vertical:
-            self._compare_scroll_ratio_y = ratio
-        else:
-            self._compare_scroll_ratio_x = ratio
+        self._compare_scroll_latest[source_bar.orientation() == Qt.Vertical] = source_bar
+        if not self._compare_scroll_pending:
+            self._compare_scroll_pending = True
+            QTimer.singleShot(0, self._flush_compare_scroll_sync)
+
+    def _flush_compare_scroll_sync(self) -> None:
+        self._compare_scroll_pending = False
+        latest = self._compare_scroll_latest
+        self._compare_scroll_latest = {}
         self._compare_syncing_scroll = True
         try:
-            for scroll in self.compare_image_scrolls.values():
-                target_bar = scroll.verticalScrollBar() if source_is_vertical else scroll.horizontalScrollBar()
-                if target_bar is source_bar:
-                    continue
-                tmax = target_bar.maximum()
-                target_bar.setValue(int(round(ratio * tmax)) if tmax > 0 else 0)
+            for source_is_vertical, source_bar in latest.items():
+                source_max = source_bar.maximum()
+                ratio = 0.0 if source_max <= 0 else source_bar.value() / source_max
+                if source_is_vertical:
+                    self._compare_scroll_ratio_y = ratio
+                else:
+                    self._compare_scroll_ratio_x = ratio
+                for scroll in self.compare_image_scrolls.values():
+                    target_bar = scroll.verticalScrollBar() if source_is_vertical else scroll.horizontalScrollBar()
+                    if target_bar is source_bar:
+                        continue
+                    tmax = target_bar.maximum()
+                    target_bar.setValue(int(round(ratio * tmax)) if tmax > 0 else 0)
         finally:
             self._compare_syncing_scroll = False
 
@@ -3919,35 +4972,44 @@ class MainWindow(QMainWindow):
         # Hidden tab scroll ranges may be finalized after tab switch.
         QTimer.singleShot(0, self._apply_compare_scroll_ratios)
 
-    def _current_compare_auto_image(self) -> QImage | None:
+    def _current_compare_auto_variant(self) -> str | None:
+        variants = ["diff", "before", "after"]
         images = [self.compare_diff_image_raw, self.compare_before_image_raw, self.compare_after_image_raw]
         if all(img is None for img in images):
             return None
         idx = self.compare_auto_cycle_index % len(images)
         for _ in range(len(images)):
-            img = images[idx]
-            if img is not None:
-                return img
+            if images[idx] is not None:
+                return variants[idx]
             idx = (idx + 1) % len(images)
         return None
 
+    def _current_compare_auto_image(self) -> QImage | None:
+        variant = self._current_compare_auto_variant()
+        if variant is None:
+            return None
+        return self._compare_raw_image_for_key(variant)
+
     def _advance_compare_auto_image(self) -> None:
         self.compare_auto_cycle_index = (self.compare_auto_cycle_index + 1) % 3
         self._render_compare_image_labels()
 
     def on_compare_zoom_fit(self) -> None:
+        self._compare_zoom_timer.stop()
         self.compare_zoom_mode = "fit"
         self._render_compare_image_labels()
 
     def on_compare_zoom_in(self) -> None:
+        self._ensure_compare_full_resolution()
         self.compare_zoom_mode = "manual"
         self.compare_zoom_scale = min(self.compare_zoom_scale * 1.25, 8.0)
-        self._render_compare_image_labels()
+        self._compare_zoom_timer.start()
 
     def on_compare_zoom_out(self) -> None:
+        self._ensure_compare_full_resolution()
         self.compare_zoom_mode = "manual"
         self.compare_zoom_scale = max(self.compare_zoom_scale / 1.25, 0.1)
-        self._render_compare_image_labels()
+        self._compare_zoom_timer.start()
 
     def on_compare_render_scale_changed(self, *_args) -> None:
         value = self.compare_render_scale_combo.currentData()
@@ -3960,13 +5022,11 @@ class MainWindow(QMainWindow):
         self.settings["compare_render_scale"] = new_scale
         self.save_settings()
         self.compare_render_cache.clear()
-        self._compare_precache_stop.set()
-        self.compare_precache_active = False
         self._set_compare_rendering_text()
         row = self.compare_item_list.currentRow()
         if row >= 0:
             self.on_compare_item_selected(row)
-        self._start_compare_precache()
+        self._restart_compare_precache()
 
     def _current_compare_image_key(self) -> str:
         idx = self.compare_image_tabs.currentIndex()
@@ -3988,6 +5048,7 @@ class MainWindow(QMainWindow):
         return self.compare_diff_image_raw
 
     def on_compare_image_wheel_zoom(self, factor: float, anchor_pos: QPoint) -> None:
+        self._ensure_compare_full_resolution()
         key = self._current_compare_image_key()
         scroll = self.compare_image_scrolls.get(key)
         raw = self._compare_raw_image_for_key(key)
@@ -4020,11 +5081,12 @@ class MainWindow(QMainWindow):
         vbar.setValue(max(0, min(vbar.maximum(), vy)))
 
     def _render_compare_image_labels(self) -> None:
+        self._compare_zoom_timer.stop()
         fit_scale = self._compute_compare_fit_scale() if self.compare_zoom_mode == "fit" else None
-        self._set_compare_image_for_key(self.compare_before_image_label, self.compare_before_image_raw, fit_scale)
-        self._set_compare_image_for_key(self.compare_after_image_label, self.compare_after_image_raw, fit_scale)
-        self._set_compare_image_for_key(self.compare_diff_image_label, self.compare_diff_image_raw, fit_scale)
-        self._set_compare_image_for_key(self.compare_auto_image_label, self._current_compare_auto_image(), fit_scale)
+        self._set_compare_image_for_key(self.compare_before_image_label, "before", fit_scale)
+        self._set_compare_image_for_key(self.compare_after_image_label, "after", fit_scale)
+        self._set_compare_image_for_key(self.compare_diff_image_label, "diff", fit_scale)
+        self._set_compare_image_for_key(self.compare_auto_image_label, self._current_compare_auto_variant(), fit_scale)
         QTimer.singleShot(0, self._apply_compare_scroll_ratios)
 
     def _apply_compare_scroll_ratios(self) -> None:
@@ -4055,30 +5117,36 @@ class MainWindow(QMainWindow):
         if scroll is None:
             return 1.0
         vp = scroll.viewport().size()
+        cache_key = (vp.width(), vp.height(), img_w, img_h)
+        if cache_key == self._compare_fit_cache_key:
+            return self._compare_fit_cache_value
         scale = min(max(1, vp.width()) / img_w, max(1, vp.height()) / img_h)
-        return max(0.05, min(scale, 8.0))
+        scale = max(0.05, min(scale, 8.0))
+        self._compare_fit_cache_key = cache_key
+        self._compare_fit_cache_value = scale
+        return scale
 
-    def _set_compare_image_for_key(self, label: QLabel, image: QImage | None, fit_scale: float | None) -> None:
+    def _set_compare_image_for_key(self, label: ScaledImageLabel, variant: str | None, fit_scale: float | None) -> None:
+        if variant is None:
+            return
+        image = self._compare_raw_image_for_key(variant)
         if image is None:
             return
-        pixmap = QPixmap.fromImage(image)
         if self.compare_zoom_mode == "fit":
             scale = fit_scale if fit_scale is not None else 1.0
         else:
             scale = self.compare_zoom_scale
-        w = max(1, int(pixmap.width() * scale))
-        h = max(1, int(pixmap.height() * scale))
-        scaled = pixmap.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        label.setPixmap(scaled)
-        label.resize(scaled.size())
+        pixmap = self._compare_raw_pixmaps.get(variant)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(image)
+            self._compare_raw_pixmaps[variant] = pixmap
+        label.set_scaled_pixmap(pixmap, scale)
 
     def refresh_compare_timeline(self) -> None:
         if self.compare_active_project is None:
             self.compare_timeline_list.clear()
             return
-        backups = collect_backup_items(self.compare_active_project, self.resolve_timeline_limit())
-        commits = collect_git_items(self.compare_active_project, self.git_path, self.resolve_timeline_limit()) if self.git_path else []
-        self.compare_items_all = sorted([*backups, *commits], key=lambda x: x.timestamp, reverse=True)[: self.resolve_timeline_limit()]
+        self.compare_items_all = self._collect_timeline_items(self.compare_active_project, self.resolve_timeline_limit())
         self.apply_compare_filter()
 
     def apply_compare_filter(self) -> None:
@@ -4104,16 +5172,38 @@ class MainWindow(QMainWindow):
             self.compare_items_filtered = [x for x in self.compare_items_all if x.source == "git"]
         else:
             self.compare_items_filtered = list(self.compare_items_all)
+        self._compare_items_by_id = {x.identifier: x for x in self.compare_items_filtered}
+
+        # Fill all three widgets in one batch each; combo rows map to identifiers through compare_item_ids.
+        labels = [item.label for item in self.compare_items_filtered]
+        self.compare_item_ids = [item.identifier for item in self.compare_items_filtered]
+        widgets = (self.compare_timeline_list, self.compare_from_combo2, self.compare_to_combo2)
+        for widget in widgets:
+            widget.setUpdatesEnabled(False)
+            widget.blockSignals(True)
+        try:
+            self.compare_timeline_list.clear()
+            self.compare_timeline_list.addItems(labels)
+            self.compare_from_combo2.clear()
+            self.compare_from_combo2.addItems(labels)
+            self.compare_to_combo2.clear()
+            self.compare_to_combo2.addItem(self.t("compare_current_project"))
+            self.compare_to_combo2.addItems(labels)
+            self.compare_to_combo2.setCurrentIndex(0)
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+                widget.setUpdatesEnabled(True)
 
-        self.compare_timeline_list.clear()
-        self.compare_from_combo2.clear()
-        self.compare_to_combo2.clear()
-        self.compare_to_combo2.addItem(self.t("compare_current_project"), "__current_project__")
-        for item in self.compare_items_filtered:
-            self.compare_timeline_list.addItem(item.label)
-            self.compare_from_combo2.addItem(item.label, item.identifier)
-            self.compare_to_combo2.addItem(item.label, item.identifier)
-        self.compare_to_combo2.setCurrentIndex(0)
+    def _compare_combo2_identifier(self, combo: QComboBox, leading: list[str]) -> str | None:
+        index = combo.currentIndex()
+        if index < 0:
+            return None
+        if index < len(leading):
+            return leading[index]
+        index -= len(leading)
+        ids = getattr(self, "compare_item_ids", [])
+        return ids[index] if index < len(ids) else None
 
     def on_compare_filter_changed(self) -> None:
         self.apply_compare_filter()
@@ -4146,6 +5236,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, self.t("compare_backup_title"), str(exc))
             return
         self.compare_backup_memo_input.clear()
+        self._invalidate_timeline_cache()
         self.refresh_compare_timeline()
 
     def _load_compare_source_map(self, source_id: str) -> dict[str, bytes]:
@@ -4153,7 +5244,7 @@ class MainWindow(QMainWindow):
             raise RuntimeError(self.t("warning_project_text"))
         if source_id == "__current_project__":
             return build_current_project_map(self.compare_active_project)
-        item = next((it for it in self.compare_items_filtered if it.identifier == source_id), None)
+        item = self._compare_items_by_id.get(source_id)
         if item is None:
             raise RuntimeError(f"Unknown source id: {source_id}")
         if item.source == "backup":
@@ -4185,9 +5276,29 @@ class MainWindow(QMainWindow):
                 return opt
         return DEFAULT_COMPARE_RENDER_SCALE
 
+    def _cache_warning_texts(self) -> None:
+        # (title, text) pairs for the validation warnings shown on every failed continue/compare click.
+        self._warn_cli = (self.t("warning_cli_title"), self.t("warning_cli_text"))
+        self._warn_project = (self.t("warning_project_title"), self.t("warning_project_text"))
+        for kind, box in self._warning_boxes.items():
+            title, text = self._warning_texts(kind)
+            box.setWindowTitle(title)
+            box.setText(text)
+
+    def _warning_texts(self, kind: str) -> tuple[str, str]:
+        return self._warn_cli if kind == "cli" else self._warn_project
+
+    def _show_warning(self, kind: str) -> None:
+        box = self._warning_boxes.get(kind)
+        if box is None:
+            title, text = self._warning_texts(kind)
+            box = QMessageBox(QMessageBox.Warning, title, text, QMessageBox.Ok, self)
+            self._warning_boxes[kind] = box
+        box.exec()
+
     def t(self, key: str, **kwargs: str) -> str:
-        table = TRANSLATIONS.get(self.language, TRANSLATIONS["en"])
-        text = table.get(key, TRANSLATIONS["en"].get(key, key))
+        # _translate is keyed by (language, key), so switching languages needs no cache reset.
+        text = _translate(self.language, key)
         return text.format(**kwargs) if kwargs else text
 
     def resolve_initial_language(self) -> str:
@@ -4199,107 +5310,32 @@ class MainWindow(QMainWindow):
         return detect_environment_language()
 
     def apply_translations(self) -> None:
-        self.setWindowTitle(self.t("window_title"))
-        self.title.setText(self.t("title"))
-        self.subtitle.setText(self.t("subtitle"))
-        self.language_label.setText(self.t("language"))
-        self.cli_box.setTitle(self.t("group_path"))
-        self.path_label.setText(self.t("cli_path"))
-        self.path_input.setPlaceholderText(self.t("cli_placeholder"))
-        self.browse_btn.setText(self.t("browse"))
-        self.detect_btn.setText(self.t("auto_detect"))
-        self.git_label.setText(self.t("git_path"))
-        self.git_refresh_btn.setText(self.t("git_refresh"))
-        self.project_box.setTitle(self.t("group_project"))
-        self.project_hint.setText(self.t("project_hint"))
-        self.open_btn.setText(self.t("open_project"))
-        self.remove_btn.setText(self.t("remove_project"))
-        self.next_box.setTitle(self.t("group_next"))
-        self.next_hint.setText(self.t("next_hint"))
-        self.proceed_btn.setText(self.t("continue"))
-        self.render_version_info()
-        self.footer.setText(self.t("footer", path=str(self.settings_store.config_path)))
-        if hasattr(self, "snapshot_title"):
-            self.snapshot_title.setText(self.t("snapshot_window_title"))
-        if hasattr(self, "snapshot_project_label") and self.snapshot_active_project is not None:
-            self.snapshot_project_label.setText(
-                self.t("snapshot_selected_project", project=str(self.snapshot_active_project))
-            )
-        if hasattr(self, "snapshot_compare_btn"):
-            self.snapshot_compare_btn.setText(self.t("snapshot_open_compare"))
-        if hasattr(self, "snapshot_back_btn"):
-            self.snapshot_back_btn.setText(self.t("snapshot_back"))
-        if hasattr(self, "snapshot_filter_label"):
-            self.snapshot_filter_label.setText(self.t("compare_filter"))
-        if hasattr(self, "snapshot_filter_both"):
-            self.snapshot_filter_both.setText(self.t("compare_filter_both"))
-        if hasattr(self, "snapshot_filter_backup"):
-            self.snapshot_filter_backup.setText(self.t("compare_filter_backup"))
-        if hasattr(self, "snapshot_filter_git"):
-            self.snapshot_filter_git.setText(self.t("compare_filter_git"))
-        if hasattr(self, "snapshot_limit_label"):
-            self.snapshot_limit_label.setText(self.t("compare_limit"))
-        if hasattr(self, "snapshot_refresh_btn"):
-            self.snapshot_refresh_btn.setText(self.t("compare_refresh"))
-        if hasattr(self, "snapshot_backup_memo_label"):
-            self.snapshot_backup_memo_label.setText(self.t("compare_backup_memo"))
-        if hasattr(self, "snapshot_backup_memo_input"):
-            self.snapshot_backup_memo_input.setPlaceholderText(self.t("compare_backup_memo_placeholder"))
-        if hasattr(self, "snapshot_create_backup_btn"):
-            self.snapshot_create_backup_btn.setText(self.t("compare_create_backup"))
-        if hasattr(self, "snapshot_from_label"):
-            self.snapshot_from_label.setText(self.t("compare_from"))
-        if hasattr(self, "snapshot_to_label"):
-            self.snapshot_to_label.setText(self.t("compare_to"))
-        if hasattr(self, "compare_title"):
-            self.compare_title.setText(self.t("compare_window_title"))
-        if hasattr(self, "compare_source_label"):
-            self.compare_source_label.setText(self.t("compare_filter"))
-        if hasattr(self, "compare_source_both"):
-            self.compare_source_both.setText(self.t("compare_filter_both"))
-        if hasattr(self, "compare_source_backup"):
-            self.compare_source_backup.setText(self.t("compare_filter_backup"))
-        if hasattr(self, "compare_source_git"):
-            self.compare_source_git.setText(self.t("compare_filter_git"))
-        if hasattr(self, "compare_limit_label"):
-            self.compare_limit_label.setText(self.t("compare_limit"))
-        if hasattr(self, "compare_refresh_btn"):
-            self.compare_refresh_btn.setText(self.t("compare_refresh"))
-        if hasattr(self, "compare_backup_memo_label"):
-            self.compare_backup_memo_label.setText(self.t("compare_backup_memo"))
-        if hasattr(self, "compare_backup_memo_input"):
-            self.compare_backup_memo_input.setPlaceholderText(self.t("compare_backup_memo_placeholder"))
-        if hasattr(self, "compare_create_backup_btn"):
-            self.compare_create_backup_btn.setText(self.t("compare_create_backup"))
-        if hasattr(self, "compare_from_label2"):
-            self.compare_from_label2.setText(self.t("compare_from"))
-        if hasattr(self, "compare_to_label2"):
-            self.compare_to_label2.setText(self.t("compare_to"))
-        if hasattr(self, "compare_run_btn2"):
-            self.compare_run_btn2.setText(self.t("compare_run"))
-        if hasattr(self, "compare_back_btn"):
-            self.compare_back_btn.setText(self.t("compare_back"))
-        if hasattr(self, "compare_items_label"):
-            self.compare_items_label.setText(self.t("compare_image_target"))
-        if hasattr(self, "compare_preview_title"):
-            self.compare_preview_title.setText(self.t("compare_image_title"))
-        if hasattr(self, "compare_zoom_out_btn"):
-            self.compare_zoom_out_btn.setText(self.t("compare_image_zoom_out"))
-        if hasattr(self, "compare_zoom_in_btn"):
-            self.compare_zoom_in_btn.setText(self.t("compare_image_zoom_in"))
-        if hasattr(self, "compare_zoom_fit_btn"):
-            self.compare_zoom_fit_btn.setText(self.t("compare_image_zoom_fit"))
-        if hasattr(self, "compare_render_scale_label"):
-            self.compare_render_scale_label.setText(self.t("compare_image_render_scale"))
-        if hasattr(self, "compare_image_tabs"):
-            self.compare_image_tabs.setTabText(0, self.t("compare_image_auto"))
-            self.compare_image_tabs.setTabText(1, self.t("compare_image_diff"))
-            self.compare_image_tabs.setTabText(2, self.t("compare_image_before"))
-            self.compare_image_tabs.setTabText(3, self.t("compare_image_after"))
-        if hasattr(self, "compare_item_list") and hasattr(self, "compare_target_labels"):
-            self._refresh_compare_item_list_labels()
-        self.render_cli_status()
-        self.render_git_status()
+        # Freeze painting while ~60 texts change so the window relayouts and repaints once.
+        self.setUpdatesEnabled(False)
+        try:
+            self.setWindowTitle(self.t("window_title"))
+            for attr, method, key in self._TRANSLATABLE:
+                widget = getattr(self, attr, None)
+                if widget is not None:
+                    getattr(widget, method)(self.t(key))
+            self.render_version_info()
+            self.footer.setText(self.t("footer", path=str(self.settings_store.config_path)))
+            if hasattr(self, "snapshot_project_label") and self.snapshot_active_project is not None:
+                self.snapshot_project_label.setText(
+                    self.t("snapshot_selected_project", project=str(self.snapshot_active_project))
+                )
+            if hasattr(self, "compare_image_tabs"):
+                self.compare_image_tabs.setTabText(0, self.t("compare_image_auto"))
+                self.compare_image_tabs.setTabText(1, self.t("compare_image_diff"))
+                self.compare_image_tabs.setTabText(2, self.t("compare_image_before"))
+                self.compare_image_tabs.setTabText(3, self.t("compare_image_after"))
+            if hasattr(self, "compare_target_model"):
+                self.compare_target_model.notify_all()
+            self.render_cli_status()
+            self.render_git_status()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.updateGeometry()
 
     def on_language_changed(self) -> None:
         code = self.language_combo.currentData()
@@ -4308,23 +5344,22 @@ class MainWindow(QMainWindow):
         if code not in SUPPORTED_LANGUAGES:
             return
         self.language = code
+        self._cache_warning_texts()
         self.settings["language"] = code
         self.save_settings()
         self.apply_translations()
 
     def load_recent_projects(self) -> None:
         self.recent_list.clear()
+        self._recent_cache = []
         recent = self.settings.get("recent_projects", [])
         if not isinstance(recent, list):
             return
 
-        selected_row = -1
+        self._recent_cache = [str(item) for item in recent]
+        self.recent_list.addItems(self._recent_cache)
         last_project = self.settings.get("last_project")
-        for item in recent:
-            path = str(item)
-            self.recent_list.addItem(QListWidgetItem(path))
-            if isinstance(last_project, str) and path == last_project:
-                selected_row = self.recent_list.count() - 1
+        selected_row = self._recent_cache.index(last_project) if last_project in self._recent_cache else -1
 
         if selected_row >= 0:
             self.recent_list.setCurrentRow(selected_row)
@@ -4332,10 +5367,7 @@ class MainWindow(QMainWindow):
             self.recent_list.setCurrentRow(0)
 
     def save_settings(self) -> None:
-        recent: list[str] = []
-        for i in range(self.recent_list.count()):
-            recent.append(self.recent_list.item(i).text())
-
+        recent = self._recent_cache
         if recent:
             self.settings["recent_projects"] = recent[:MAX_RECENT]
         else:
@@ -4348,6 +5380,9 @@ class MainWindow(QMainWindow):
         selected = self.selected_project()
         if selected:
             self.settings["last_project"] = selected
+        self._settings_save_timer.start()
+
+    def _write_settings(self) -> None:
         self.settings_store.save(self.settings)
 
     def selected_project(self) -> str | None:
@@ -4408,7 +5443,7 @@ class MainWindow(QMainWindow):
 
     def validate_manual_cli(self, path_text: str) -> None:
         path = Path(path_text)
-        candidate = probe_kicad_cli(path)
+        candidate = probe_kicad_cli_cached(path)
         if not candidate:
             self.cli_candidate = None
             self.set_cli_status("status_invalid", False)
@@ -4464,43 +5499,82 @@ class MainWindow(QMainWindow):
         else:
             self.set_git_status("git_ok_plain", "ok")
 
-    def fetch_latest_release_version(self) -> str:
-        req = urllib.request.Request(
-            GITHUB_LATEST_RELEASE_API,
-            headers={"Accept": "application/vnd.github+json", "User-Agent": "kicad-snapshot"},
-        )
-        with urllib.request.urlopen(req, timeout=8) as resp:
-            payload = json.loads(resp.read().decode("utf-8", errors="replace"))
+    def fetch_latest_release_version(
+        self,
+        etag: str | None = None,
+        cached_tag: str | None = None,
+    ) -> tuple[str, str | None]:
+        # Returns (version, etag). A conditional request answered with 304 reuses cached_tag.
+        headers = {"Accept": "application/vnd.github+json", "User-Agent": "kicad-snapshot"}
+        if etag and cached_tag:
+            headers["If-None-Match"] = etag
+        req = urllib.request.Request(GITHUB_LATEST_RELEASE_API, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=8) as resp:
+                payload = json.loads(resp.read().decode("utf-8", errors="replace"))
+                new_etag = resp.headers.get("ETag")
+        except urllib.error.HTTPError as exc:
+            if exc.code == 304 and cached_tag:
+                return cached_tag, etag
+            raise
         tag = str(payload.get("tag_name", "")).strip()
         if not tag:
             raise RuntimeError("tag_name not found")
-        return tag[1:] if tag.startswith("v") else tag
+        return (tag[1:] if tag.startswith("v") else tag), new_etag
 
     def on_check_latest_version(self) -> None:
         self.latest_version_state = "checking"
         self.render_version_info()
+        cached_tag = self.settings.get("latest_release_tag")
+        cached_tag = cached_tag if isinstance(cached_tag, str) and cached_tag else None
+        checked_at = self.settings.get("latest_release_ts")
+        if cached_tag and isinstance(checked_at, int) and 0 <= time.time() - checked_at < LATEST_RELEASE_CHECK_TTL_SECONDS:
+            self._apply_latest_version(cached_tag)
+            return
+        etag = self.settings.get("latest_release_etag")
+        etag = etag if isinstance(etag, str) else None
         self.version_check_btn.setEnabled(False)
-        QApplication.processEvents()
-        try:
-            latest = self.fetch_latest_release_version()
-            self.latest_version = latest
-            current_tuple, _ = parse_version_text(__version__)
-            latest_tuple, _ = parse_version_text(latest)
-            if current_tuple is not None and latest_tuple is not None:
-                if current_tuple == latest_tuple:
-                    self.latest_version_state = "up_to_date"
-                elif current_tuple < latest_tuple:
-                    self.latest_version_state = "available"
-                else:
-                    self.latest_version_state = "ahead"
+        # Fetch off the GUI thread; the result comes back through a queued signal.
+        task = BackgroundTask(
+            "latest_version",
+            lambda: self.fetch_latest_release_version(etag, cached_tag),
+        )
+        task.signals.finished.connect(self._on_latest_version_fetched)
+        task.signals.failed.connect(self._on_latest_version_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_latest_version_fetched(self, _key: str, result: object) -> None:
+        latest, etag = result
+        self.settings["latest_release_tag"] = latest
+        self.settings["latest_release_ts"] = int(time.time())
+        if etag:
+            self.settings["latest_release_etag"] = etag
+        else:
+            self.settings.pop("latest_release_etag", None)
+        self.save_settings()
+        self._apply_latest_version(latest)
+
+    def _apply_latest_version(self, latest: str) -> None:
+        self.latest_version = latest
+        current_tuple, _ = parse_version_text(__version__)
+        latest_tuple, _ = parse_version_text(self.latest_version)
+        if current_tuple is not None and latest_tuple is not None:
+            if current_tuple == latest_tuple:
+                self.latest_version_state = "up_to_date"
+            elif current_tuple < latest_tuple:
+                self.latest_version_state = "available"
             else:
-                self.latest_version_state = "unknown"
-        except Exception:
-            self.latest_version = None
-            self.latest_version_state = "failed"
-        finally:
-            self.version_check_btn.setEnabled(True)
-            self.render_version_info()
+                self.latest_version_state = "ahead"
+        else:
+            self.latest_version_state = "unknown"
+        self.version_check_btn.setEnabled(True)
+        self.render_version_info()
+
+    def _on_latest_version_failed(self, _key: str, _message: str) -> None:
+        self.latest_version = None
+        self.latest_version_state = "failed"
+        self.version_check_btn.setEnabled(True)
+        self.render_version_info()
 
     def open_repository(self) -> None:
         QDesktopServices.openUrl(QUrl("https://github.com/tanakamasayuki/kicad-snapshot"))
@@ -4549,13 +5623,15 @@ class MainWindow(QMainWindow):
     def add_recent_project(self, project_path: str) -> None:
         normalized = str(Path(project_path))
 
-        for i in range(self.recent_list.count()):
-            if self.recent_list.item(i).text() == normalized:
-                self.recent_list.takeItem(i)
-                break
+        if normalized in self._recent_cache:
+            row = self._recent_cache.index(normalized)
+            del self._recent_cache[row]
+            self.recent_list.takeItem(row)
 
+        self._recent_cache.insert(0, normalized)
         self.recent_list.insertItem(0, normalized)
-        while self.recent_list.count() > MAX_RECENT:
+        while len(self._recent_cache) > MAX_RECENT:
+            self._recent_cache.pop()
             self.recent_list.takeItem(self.recent_list.count() - 1)
 
         self.recent_list.setCurrentRow(0)
@@ -4568,6 +5644,7 @@ class MainWindow(QMainWindow):
             return
 
         self.recent_list.takeItem(row)
+        del self._recent_cache[row]
         self.save_settings()
         self.update_next_state()
 
@@ -4581,49 +5658,63 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, self.t("compare_started_title"), self.t("compare_need_two"))
             return
         if self.cli_candidate is None:
-            QMessageBox.warning(self, self.t("warning_cli_title"), self.t("warning_cli_text"))
+            self._show_warning("cli")
             return
-        from_id = self.compare_from_combo2.currentData()
-        to_id = self.compare_to_combo2.currentData()
+        from_id = self._compare_combo2_identifier(self.compare_from_combo2, [])
+        to_id = self._compare_combo2_identifier(self.compare_to_combo2, ["__current_project__"])
         if isinstance(from_id, str) and isinstance(to_id, str) and from_id == to_id:
             QMessageBox.warning(self, self.t("compare_started_title"), self.t("compare_same"))
             return
         if not isinstance(from_id, str) or not isinstance(to_id, str):
             QMessageBox.warning(self, self.t("compare_started_title"), self.t("compare_need_two"))
             return
-        try:
-            before_map = self._load_compare_source_map(from_id)
-            after_map = self._load_compare_source_map(to_id)
-        except Exception as exc:
-            QMessageBox.warning(self, self.t("compare_started_title"), str(exc))
+        if self._run_compare_inflight is not None:
             return
+        self._run_compare_generation += 1
+        self._run_compare_inflight = str(self._run_compare_generation)
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        task = BackgroundTask(
+            self._run_compare_inflight,
+            lambda: self._load_source_maps_parallel(self._load_compare_source_map, from_id, to_id),
+        )
+        task.signals.finished.connect(self._on_run_compare_maps_loaded)
+        task.signals.failed.connect(self._on_run_compare_maps_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def _finish_run_compare_load(self, key: str) -> bool:
+        if key != self._run_compare_inflight:
+            return False
+        self._run_compare_inflight = None
+        QApplication.restoreOverrideCursor()
+        return True
 
+    def _on_run_compare_maps_loaded(self, key: str, result: object) -> None:
+        if not self._finish_run_compare_load(key) or self.cli_candidate is None:
+            return
+        before_map, after_map = result
         dialog = ItemDiffDialog(
             title=self.t("compare_started_title"),
             cli_path=self.cli_candidate.path,
             before_map=before_map,
             after_map=after_map,
-            t_func=lambda key: self.t(key),
+            t_func=self.t,
             parent=self,
         )
         dialog.exec()
 
+    def _on_run_compare_maps_failed(self, key: str, message: str) -> None:
+        if not self._finish_run_compare_load(key):
+            return
+        QMessageBox.warning(self, self.t("compare_started_title"), message)
+
     def on_continue(self) -> None:
         if not self.cli_candidate:
-            QMessageBox.warning(
-                self,
-                self.t("warning_cli_title"),
-                self.t("warning_cli_text"),
-            )
+            self._show_warning("cli")
             return
 
         project = self.selected_project()
         if not project:
-            QMessageBox.warning(
-                self,
-                self.t("warning_project_title"),
-                self.t("warning_project_text"),
-            )
+            self._show_warning("project")
             return
 
         self.show_snapshot_page(project=project)
@@ -4631,7 +5722,7 @@ class MainWindow(QMainWindow):
 
 def main() -> None:
     app = QApplication(sys.argv)
-    app.setFont(QFont("Segoe UI", 10))
+    app.setFont(app_font())
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import re
 from pathlib import Path
 
@@ -11,62 +12,76 @@ PYPROJECT = ROOT / "pyproject.toml"
 INIT_FILE = ROOT / "src" / "kicad_snapshot" / "__init__.py"
 CHANGELOG = ROOT / "CHANGELOG.md"
 
+_VERSION_LINE_PY = re.compile(r'^version = "[^"]+"$', re.M)
+_VERSION_LINE_INIT = re.compile(r'^__version__ = "[^"]+"$', re.M)
+_SEMVER = re.compile(r"\d+\.\d+\.\d+")
+_UNRELEASED_RE = re.compile(r"^## Unreleased$", re.M)
+_SECTION_RE = re.compile(r"^## ", re.M)
 
-def update_pyproject(version: str) -> None:
-    text = PYPROJECT.read_text(encoding="utf-8")
-    updated = re.sub(
-        r'(?m)^version = "[^"]+"$',
-        f'version = "{version}"',
-        text,
-        count=1,
+
+def _replace_version_line(text: str, pattern: re.Pattern[str], replacement: str, error: str) -> str:
+    # Locate the line once and splice the literal replacement in; no regex substitution pass.
+    match = pattern.search(text)
+    if match is None:
+        raise RuntimeError(error)
+    return f"{text[: match.start()]}{replacement}{text[match.end() :]}"
+
+
+def update_pyproject(text: str, version: str) -> str:
+    return _replace_version_line(
+        text, _VERSION_LINE_PY, f'version = "{version}"', "Failed to update version in pyproject.toml"
     )
-    if updated == text:
-        raise RuntimeError("Failed to update version in pyproject.toml")
-    PYPROJECT.write_text(updated, encoding="utf-8")
-
-
-def update_init(version: str) -> None:
-    text = INIT_FILE.read_text(encoding="utf-8")
-    updated = re.sub(
-        r'(?m)^__version__ = "[^"]+"$',
-        f'__version__ = "{version}"',
-        text,
-        count=1,
+
+
+def update_init(text: str, version: str) -> str:
+    return _replace_version_line(
+        text, _VERSION_LINE_INIT, f'__version__ = "{version}"', "Failed to update __version__ in __init__.py"
     )
-    if updated == text:
-        raise RuntimeError("Failed to update __version__ in __init__.py")
-    INIT_FILE.write_text(updated, encoding="utf-8")
 
 
-def update_changelog(version: str) -> None:
-    lines = CHANGELOG.read_text(encoding="utf-8").splitlines()
+def update_changelog(text: str, version: str) -> str:
+    unreleased = _UNRELEASED_RE.search(text)
+    if unreleased is None:
+        raise RuntimeError("CHANGELOG.md must contain '## Unreleased'")
+
+    # Slice around the Unreleased block so only that block is split into lines.
+    head_end = unreleased.end()
+    next_section = _SECTION_RE.search(text, head_end)
+    tail_start = len(text) if next_section is None else next_section.start()
+    section = "\n".join(ln for ln in text[head_end:tail_start].splitlines() if ln.strip()) or "- (no changes)"
+    updated = f"{text[:head_end]}\n\n## {version}\n{section}"
+    tail = text[tail_start:]
+    if tail:
+        updated = f"{updated}\n\n{tail}"
+    return updated.rstrip() + "\n"
+
+
+def _load() -> dict[Path, str]:
+    return {path: path.read_text(encoding="utf-8") for path in (PYPROJECT, INIT_FILE, CHANGELOG)}
+
+
+def _transform(texts: dict[Path, str], version: str) -> dict[Path, str]:
+    return {
+        PYPROJECT: update_pyproject(texts[PYPROJECT], version),
+        INIT_FILE: update_init(texts[INIT_FILE], version),
+        CHANGELOG: update_changelog(texts[CHANGELOG], version),
+    }
+
+
+def _commit(texts: dict[Path, str]) -> None:
+    # Write every file to a sibling temp first so a failed write leaves all three untouched.
+    staged: list[tuple[Path, Path]] = []
     try:
-        unreleased_idx = lines.index("## Unreleased")
-    except ValueError as exc:
-        raise RuntimeError("CHANGELOG.md must contain '## Unreleased'") from exc
-
-    tail_start = len(lines)
-    for i in range(unreleased_idx + 1, len(lines)):
-        if lines[i].startswith("## "):
-            tail_start = i
-            break
-
-    unreleased_block = lines[unreleased_idx + 1 : tail_start]
-    unreleased_items = [ln for ln in unreleased_block if ln.strip()]
-
-    new_lines: list[str] = []
-    new_lines.extend(lines[: unreleased_idx + 1])
-    new_lines.append("")
-    new_lines.append(f"## {version}")
-    if unreleased_items:
-        new_lines.extend(unreleased_items)
-    else:
-        new_lines.append("- (no changes)")
-    if tail_start < len(lines):
-        new_lines.append("")
-        new_lines.extend(lines[tail_start:])
-
-    CHANGELOG.write_text("\n".join(new_lines).rstrip() + "\n", encoding="utf-8")
+        for path, text in texts.items():
+            tmp = path.with_name(f".{path.name}.tmp")
+            tmp.write_bytes(text.encode("utf-8"))
+            staged.append((tmp, path))
+    except BaseException:
+        for tmp, _ in staged:
+            tmp.unlink(missing_ok=True)
+        raise
+    for tmp, path in staged:
+        os.replace(tmp, path)
 
 
 def main() -> None:
@@ -74,12 +89,11 @@ def main() -> None:
     parser.add_argument("--version", required=True, help="Release version (e.g. 0.0.1)")
     args = parser.parse_args()
     version = args.version.strip()
-    if not re.fullmatch(r"\d+\.\d+\.\d+", version):
+    if not _SEMVER.fullmatch(version):
         raise SystemExit("Version must be semantic format: X.Y.Z")
 
-    update_pyproject(version)
-    update_init(version)
-    update_changelog(version)
+    # All edits are computed in memory before anything is written.
+    _commit(_transform(_load(), version))
     print(f"Prepared release: {version}")
 
 